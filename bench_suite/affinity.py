@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import glob
+
+from .utils import print_warn
+
+
+def parse_cpu_list(text):
+    """ Parses kernel CPU list syntax like "0-3,8,10-11" into a list of ints. """
+    cpus = []
+    for part in text.strip().split(","):
+        if part == "":
+            continue
+        if "-" in part:
+            first, last = part.split("-")
+            cpus += range(int(first), int(last) + 1)
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def get_allowed_cpus():
+    """
+    Returns the set of logical CPUs this process may run on (restricted e.g. by
+    cgroup cpusets or an outer taskset), or None if unavailable.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Cpus_allowed_list:"):
+                    return set(parse_cpu_list(line.split(":", 1)[1]))
+    except (IOError, OSError):
+        pass
+    return None
+
+
+def get_physical_cores():
+    """
+    Returns a list of physical cores, each represented by the sorted list
+    of its logical CPUs (i.e., its SMT siblings). sysfs lists all CPUs of
+    the host, only the CPUs this process may run on are included.
+    """
+    sibling_files = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/topology/thread_siblings_list")
+
+    cores = set()
+    for fn in sibling_files:
+        with open(fn) as f:
+            cores.add(tuple(sorted(parse_cpu_list(f.read()))))
+
+    if len(cores) == 0:
+        # no sysfs topology available, fall back to treating each online CPU as a core
+        with open("/sys/devices/system/cpu/online") as f:
+            cores = set([(cpu,) for cpu in parse_cpu_list(f.read())])
+
+    allowed_cpus = get_allowed_cpus()
+    if allowed_cpus is not None:
+        cores = set([
+            tuple([cpu for cpu in core if cpu in allowed_cpus])
+            for core in cores
+        ]) - set([()])
+
+    return sorted([list(core) for core in cores])
+
+
+def allocate_cpu_sets(num_jobs, cores_per_job=1):
+    """
+    Assigns each job a dedicated set of physical cores. Only the first logical
+    CPU of every core is handed out, so SMT siblings stay idle and jobs never
+    share a core. Core 0 is kept free for the runner itself if possible.
+    """
+    cores = get_physical_cores()
+
+    if len(cores) > num_jobs * cores_per_job:
+        cores = [core for core in cores if 0 not in core]
+
+    num_available = len(cores) // cores_per_job
+    if num_available < num_jobs:
+        print_warn("Only {} physical cores available, reducing number of jobs from {} to {}.".format(
+            len(cores), num_jobs, max(num_available, 1)
+        ))
+        num_jobs = max(num_available, 1)
+
+    cpu_sets = []
+    for i in xrange(num_jobs):
+        job_cores = cores[i * cores_per_job:(i + 1) * cores_per_job]
+        cpu_sets.append([core[0] for core in job_cores])
+
+    return cpu_sets
+
+
+def cpu_set_to_str(cpus):
+    return ",".join([str(cpu) for cpu in cpus])
@@ -2,8 +2,10 @@
 
 from __future__ import division, print_function
 
+import os
+import math
 import traceback
-from .utils import print_error
+from .utils import print_error, read_yaml
 
 
 class Sizes(object):
@@ -23,34 +25,209 @@ class Sizes(object):
             return 3
 
 
-def default_runtime_extractor(b_entry, stage_names, add_total_stage=True):
+# Benchmark classes declare their problem sizes as a ladder, i.e., an ordered list of
+# size labels from smallest to largest (`size_ladder`), along with a classmethod
+# `size_magnitude(size, stage)` returning the numeric problem size used for scaling fits.
+# Sizes.S/M/L is the default ladder.
 
-    num_stages = len(stage_names)
-    runtimes_per_stage = [[] for _ in stage_names]
+def log_spaced_sizes(smallest, largest, num_sizes):
+    """ Integer problem sizes from smallest to largest, evenly spaced on a log scale. """
+    if num_sizes == 1:
+        return [int(largest)]
+    log_step = (math.log(largest) - math.log(smallest)) / (num_sizes - 1)
+    return [
+        int(round(math.exp(math.log(smallest) + i * log_step)))
+        for i in xrange(num_sizes)
+    ]
 
-    for size in Sizes:
-        files = b_entry.result_files(size)
-        for fn in files:
-            with open(fn) as f:
-                try:
-                    for i in xrange(num_stages):
-                        t = float(f.readline())
-                        runtimes_per_stage[i].append(t)
-                except ValueError, e:
-                    print_error("Output did not fulfil expected format:")
-                    print(traceback.format_exc())
+
+def get_size_ladder(meta_data):
+    return list(getattr(meta_data, "size_ladder", Sizes))
+
+
+def get_largest_size(meta_data):
+    return get_size_ladder(meta_data)[-1]
+
+
+# Thread sweeps run the sizes listed in `thread_sweep_sizes` (default: the largest size).
+# Sizes listed in `weak_scaling_sizes` keep the work per thread fixed (weak scaling),
+# all others the total work (strong scaling). Sweep sizes may be outside of the ladder.
+
+def get_thread_sweep_sizes(meta_data):
+    return list(getattr(meta_data, "thread_sweep_sizes", [get_largest_size(meta_data)]))
+
+
+def is_weak_scaling_size(meta_data, size):
+    return size in getattr(meta_data, "weak_scaling_sizes", [])
+
+
+# Pseudo-stage for the difference between the wall time measured by the framework
+# and the sum of all stages, i.e., process startup, runtime initialization, teardown.
+overhead_stage = "Overhead"
+
+# Pseudo-stage collecting the timeout limits of runs which have been killed,
+# i.e., "Timeouts => size => list of timeouts [sec]".
+timeout_stage = "Timeouts"
+
+# Metrics which the framework records for every run (from the resource usage
+# of the process), in addition to the stages reported by the implementations.
+resource_metrics = ["Peak RSS", "CPU time"]
+
+resource_metric_units = {
+    "Peak RSS": "MB",
+    "CPU time": "sec",
+}
+
+
+class ThroughputMetric(object):
+    """
+    Throughput derived from the run time of a stage: work(size) returns the amount
+    of work the stage performs for a size (e.g., MB, GFLOP, or number of operations).
+    The metric is reported either as work per second, or, if per_operation is set,
+    as time per unit of work (in seconds multiplied by time_scale, e.g., 1e9 for ns).
+    """
+
+    def __init__(self, unit, work, per_operation=False, time_scale=1.0):
+        self.unit = unit
+        self.work = work
+        self.per_operation = per_operation
+        self.time_scale = time_scale
+
+    @property
+    def higher_is_better(self):
+        return not self.per_operation
+
+    def from_runtime(self, runtime, size):
+        work = self.work(size)
+        if self.per_operation:
+            return runtime * self.time_scale / work
+        if runtime <= 0:
+            return None
+        return work / runtime
+
+
+def get_throughput_metric(meta_data, stage):
+    """ Returns the ThroughputMetric a benchmark declares for a stage, or None. """
+    return getattr(meta_data, "throughput_metrics", {}).get(stage)
+
+
+def run_meta_filename(stdout_filename):
+    """ Returns the path of the meta data file that accompanies a stdout file. """
+    dir_path, basename = os.path.split(stdout_filename)
+    return os.path.join(dir_path, basename.replace("stdout_", "meta_", 1) + ".yml")
+
+
+def get_timeout(meta_data, entry_timeouts, size, default_timeout=None):
+    """
+    Determines the timeout of a run. The timeout from the benchmark.yml of an entry
+    takes precedence over the timeouts of the benchmark class, followed by the default.
+    Both can either be a number of seconds, or a dict "size => seconds".
+    """
+    for timeouts in [entry_timeouts, getattr(meta_data, "timeouts", None)]:
+        if isinstance(timeouts, dict):
+            timeouts = timeouts.get(size)
+        if timeouts is not None:
+            return timeouts
+    return default_timeout
+
+
+def get_benchmark_args(meta_data, size, input_format=None, threads=1):
+    """
+    Returns the command line arguments of a run. Benchmarks supporting several input
+    formats list them in `input_formats`, the first one being the default. Entries
+    select another format with the key "input-format" in their benchmark.yml.
+    Benchmarks setting `thread_count_arg` receive the number of threads as well.
+    """
+    kwargs = dict()
+    if input_format is not None:
+        input_formats = getattr(meta_data, "input_formats", [])
+        if input_format not in input_formats:
+            raise ValueError("Benchmark {} does not support input format '{}' (supported: {})".format(
+                meta_data.__name__, input_format, ", ".join(input_formats) or "none"
+            ))
+        kwargs["input_format"] = input_format
+    if getattr(meta_data, "thread_count_arg", False):
+        kwargs["threads"] = threads
+    return meta_data.benchmark_args(size, **kwargs)
+
+
+def read_stage_runtimes(filename, num_stages):
+    """
+    Reads the stage run times from the first lines of a stdout file.
+    Returns None if the output does not fulfil the expected format.
+    """
+    runtimes = []
+    with open(filename) as f:
+        try:
+            for i in xrange(num_stages):
+                runtimes.append(float(f.readline()))
+        except ValueError, e:
+            print_error("Output did not fulfil expected format [{}]:".format(filename))
+            print(traceback.format_exc())
+            return None
+    return runtimes
+
+
+def read_run_meta(stdout_filename):
+    """ Returns the meta data recorded by the framework for a run (empty if unavailable). """
+    meta_filename = run_meta_filename(stdout_filename)
+    if not os.path.exists(meta_filename):
+        return {}
+    return read_yaml(meta_filename) or {}
+
+
+def get_resource_metrics(run_meta):
+    """
+    Returns a dict of "resource metric => value" from the meta data of a run,
+    or None if no resource usage has been recorded for the run.
+    """
+    resource_usage = run_meta.get("resource_usage")
+    if resource_usage is None:
+        return None
+    return {
+        "Peak RSS": resource_usage["peak_rss"],
+        "CPU time": resource_usage["user_time"] + resource_usage["system_time"],
+    }
+
+
+def default_runtime_extractor(runs, stage_names, sizes=Sizes, add_total_stage=True, add_framework_metrics=True):
+    """
+    Returns a dict of "stage => size => list of runtimes" from the runs of an entry
+    as loaded from the result store. Since the runtimes are grouped by size explicitly,
+    sizes may have different numbers of valid runs. Runs of sizes which are not part
+    of the given size ladder (anymore) are ignored. The overhead and the resource
+    metrics measured by the framework are added like additional stages.
+    """
+
+    result_stages = list(stage_names) + (["Total"] if add_total_stage else [])
+    if add_framework_metrics:
+        result_stages += [overhead_stage, timeout_stage] + resource_metrics
 
     result = {
-        stage: runtimes_per_stage[j] for j, stage in enumerate(stage_names)
+        stage: {size: [] for size in sizes} for stage in result_stages
     }
 
-    if add_total_stage:
-        N = len(runtimes_per_stage[0])
-        runtimes_total = [
-            sum([runtimes_per_stage[j][i] for j in xrange(num_stages)])
-            for i in xrange(N)
-        ]
-        result["Total"] = runtimes_total
+    for run in runs:
+        size = run["size"]
+        if size not in result[result_stages[0]]:
+            continue
+        if run.get("status") == "timeout":
+            if add_framework_metrics:
+                result[timeout_stage][size].append(run["timeout"])
+            continue
+        if run.get("status") != "ok" or any(stage not in run["stages"] for stage in stage_names):
+            continue
+        runtimes = [run["stages"][stage] for stage in stage_names]
+        for stage, t in zip(stage_names, runtimes):
+            result[stage][size].append(t)
+        if add_total_stage:
+            result["Total"][size].append(sum(runtimes))
+        if add_framework_metrics:
+            if run.get("wall_time") is not None:
+                result[overhead_stage][size].append(run["wall_time"] - sum(runtimes))
+            metrics = get_resource_metrics(run)
+            if metrics is not None:
+                for metric in resource_metrics:
+                    result[metric][size].append(metrics[metric])
 
     return result
-
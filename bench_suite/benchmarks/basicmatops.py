@@ -5,11 +5,19 @@ from __future__ import division, print_function
 import textwrap
 import os
 
-from ..base import Sizes, default_runtime_extractor
-from ..utils import print_warn
+from ..base import log_spaced_sizes, default_runtime_extractor, ThroughputMetric
 from .. import generators
 
 
+# log-spaced matrix sizes from N = 100 to N = 500
+_matrix_sizes = log_spaced_sizes(100, 500, 5)
+_size_ladder = ["N{}".format(N) for N in _matrix_sizes]
+
+
+def _matrix_size(size):
+    return dict(zip(_size_ladder, _matrix_sizes))[size]
+
+
 class BasicMatOps(object):
 
     title = "Basic Matrix Operations"
@@ -24,7 +32,7 @@ class BasicMatOps(object):
 
     The benchmark is divided into three stages:
 
-    - **IO**: Read two CSVs and construct matrices
+    - **IO**: Read two CSVs (or binary files) and construct matrices
     - **Add**: Add matrices
     - **Multiply**: Multiply matrices
 
@@ -41,6 +49,12 @@ class BasicMatOps(object):
     Note: The framework may pass the same path as both first and second matrix.
     This must not be exploited, i.e., each matrix should still be read individually.
 
+    Implementations may request the binary input format by setting `input-format: npy`
+    in their benchmark.yml. The matrices are then passed as
+    [.npy files](https://docs.scipy.org/doc/numpy/neps/npy-format.html), i.e., raw
+    little-endian float64 values in row-major order behind a header, which can be
+    memory-mapped instead of parsed. The values are identical to the CSVs.
+
     <div class="page-header"></div>
     #### Control Output
 
@@ -51,22 +65,39 @@ class BasicMatOps(object):
 
     """)
 
+    size_ladder = _size_ladder
+
     _datafile = {
-        Sizes.S: os.path.abspath("data/generated/matrix_S.txt"),
-        Sizes.M: os.path.abspath("data/generated/matrix_M.txt"),
-        Sizes.L: os.path.abspath("data/generated/matrix_L.txt"),
+        size: os.path.abspath("data/generated/matrix_{}.txt".format(size))
+        for size in _size_ladder
+    }
+
+    _datafile_npy = {
+        size: os.path.abspath("data/generated/matrix_{}.npy".format(size))
+        for size in _size_ladder
     }
 
-    sizes = {
-        Sizes.S: 100,
-        Sizes.M: 300,
-        Sizes.L: 500,
+    input_formats = ["csv", "npy"]
+
+    sizes = dict(zip(_size_ladder, _matrix_sizes))
+
+    size_quantity = "N"
+
+    # the naive implementations of interpreted languages are very slow for large N,
+    # the timeouts follow the cubic complexity of the multiplication (1800 sec for N = 500)
+    timeouts = {
+        size: int(max(60, 1800 * (N / 500) ** 3))
+        for size, N in zip(_size_ladder, _matrix_sizes)
     }
 
     @classmethod
     def size_description(cls, size):
         return "N = {}".format(cls.sizes[size])
 
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        return cls.sizes[size]
+
     stages = ["Total", "IO", "Add", "Mul"]
 
     linear_scales = {
@@ -76,28 +107,41 @@ class BasicMatOps(object):
         "Mul": False,
     }
 
+    # floating point operations: N^2 additions, N^3 multiplications plus N^3 additions
+    throughput_metrics = {
+        "Add": ThroughputMetric("GFLOP/s", lambda size: _matrix_size(size) ** 2 / 1e9),
+        "Mul": ThroughputMetric("GFLOP/s", lambda size: 2 * _matrix_size(size) ** 3 / 1e9),
+    }
+
+    # the speedup of thread sweeps is reported for the multiplication
+    thread_scaling_stage = "Mul"
+
     @classmethod
-    def benchmark_args(cls, size):
+    def benchmark_args(cls, size, input_format="csv"):
+        datafile = cls._datafile_npy[size] if input_format == "npy" else cls._datafile[size]
         return [
             str(cls.sizes[size]),
-            cls._datafile[size],
-            cls._datafile[size],
+            datafile,
+            datafile,
         ]
 
     @classmethod
     def ensure_data_exists(cls):
-        for size, f in cls._datafile.iteritems():
-            if not os.path.exists(f):
-                print_warn(
-                    " *** Generating data [{}], this might take a while...".format(f)
-                )
-                generators.generate_matrix(f, cls.sizes[size])
+        # the binary files use the seed of the CSVs, so both contain the same matrices
+        generators.ensure_datasets([
+            (f, generators.generate_matrix, {"N": cls.sizes[size]})
+            for size, f in sorted(cls._datafile.iteritems())
+        ] + [
+            (f, generators.generate_matrix_npy, {"N": cls.sizes[size], "seed": generators.dataset_seed(cls._datafile[size])})
+            for size, f in sorted(cls._datafile_npy.iteritems())
+        ])
 
     @classmethod
-    def result_extractor(cls, b_entry):
+    def result_extractor(cls, runs):
         result = default_runtime_extractor(
-            b_entry,
+            runs,
             cls.stages[1:],
+            cls.size_ladder,
             add_total_stage=True
         )
         return result
@@ -4,7 +4,15 @@ from __future__ import division, print_function
 
 import textwrap
 
-from ..base import Sizes, default_runtime_extractor
+from ..base import Sizes, default_runtime_extractor, ThroughputMetric
+
+
+def _naive_recursion_calls(N):
+    """ Number of calls of the naive recursion for N, i.e., 2 * fib(N + 1) - 1. """
+    a, b = 0, 1
+    for _ in xrange(N + 1):
+        a, b = b, a + b
+    return 2 * a - 1
 
 
 class Fibonacci(object):
@@ -28,6 +36,9 @@ class Fibonacci(object):
             checksum += fibonacci_iterative(N)
             checksum %= 2147483647
 
+    Additional implementations may replace the algorithm of a stage by a faster one
+    (e.g. memoization or fast doubling), as long as they follow the checksum protocol.
+
     Benchmark aspects: Recursion
 
     <div class="page-header"></div>
@@ -47,16 +58,27 @@ class Fibonacci(object):
 
     """)
 
+    size_ladder = list(Sizes)
+
     sizes = {
         Sizes.S: (34, int(1.45 ** 32)),
         Sizes.M: (36, int(1.45 ** 34)),
         Sizes.L: (38, int(1.45 ** 36)),
     }
 
+    size_quantity = "N (naive recursion), N * M (other stages)"
+
     @classmethod
     def size_description(cls, size):
         return "N = {}, M = {}".format(*cls.sizes[size])
 
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        N, M = cls.sizes[size]
+        if stage in ["Tail Recursion", "Iterative"]:
+            return N * M
+        return N
+
     stages = ["Total", "Naive Recursion", "Tail Recursion", "Iterative"]
 
     linear_scales = {
@@ -66,6 +88,22 @@ class Fibonacci(object):
         "Iterative": False,
     }
 
+    # the last two stages compute fib(N) M times
+    throughput_metrics = {
+        "Naive Recursion": ThroughputMetric(
+            "ns/call", lambda size: _naive_recursion_calls(Fibonacci.sizes[size][0]),
+            per_operation=True, time_scale=1e9,
+        ),
+        "Tail Recursion": ThroughputMetric(
+            "ns/iteration", lambda size: Fibonacci.sizes[size][1],
+            per_operation=True, time_scale=1e9,
+        ),
+        "Iterative": ThroughputMetric(
+            "ns/iteration", lambda size: Fibonacci.sizes[size][1],
+            per_operation=True, time_scale=1e9,
+        ),
+    }
+
     @classmethod
     def benchmark_args(cls, size):
         return [str(N) for N in cls.sizes[size]]
@@ -75,10 +113,11 @@ class Fibonacci(object):
         pass
 
     @classmethod
-    def result_extractor(cls, b_entry):
+    def result_extractor(cls, runs):
         result = default_runtime_extractor(
-            b_entry,
+            runs,
             cls.stages[1:],
+            cls.size_ladder,
             add_total_stage=True
         )
         return result
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import textwrap
+import os
+
+from ..base import Sizes, default_runtime_extractor
+from .. import generators
+
+
+class Json(object):
+
+    title = "JSON"
+
+    description = textwrap.dedent("""\
+    Parse a large JSON document, aggregate over all of its values, and serialize it again.
+    The document is a list of nested records, each containing values of all JSON types,
+    lists, objects with varying keys, and a random number of child records (up to depth 3).
+
+    The benchmark is divided into four stages:
+
+    - **IO**: Read the file into memory.
+    - **Parse**: Parse the JSON into the native data structures (or a DOM) of the language.
+    - **Traverse**: Visit all values: count the keys of all objects, and sum up all numbers
+      (integers and floats, but not booleans).
+    - **Serialize**: Serialize the document to a JSON string again.
+
+    Implementations may process the document incrementally, e.g., record by record with
+    a streaming parser. In this case, the time of each stage is accumulated over all records.
+
+    Benchmark aspects: Parsing, string handling, allocation of many small objects, recursion
+
+    <div class="page-header"></div>
+    #### Input
+
+    - Path of the JSON file to read.
+
+    <div class="page-header"></div>
+    #### Control Output
+
+    After writing the stage run times to STDOUT, the implementations should print:
+
+    - Number of keys of all objects
+    - Sum of all numbers in scientific notation with 6 decimal places (e.g. `1.234567e+08`)
+
+    """)
+
+    size_ladder = list(Sizes)
+
+    sizes = {
+        Sizes.S: 5000,
+        Sizes.M: 15000,
+        Sizes.L: 50000,
+    }
+
+    _datafile = {
+        size: os.path.abspath("data/generated/records_{}.json".format(size))
+        for size in Sizes
+    }
+
+    size_quantity = "Number of records"
+
+    @classmethod
+    def size_description(cls, size):
+        return "{} records".format(cls.sizes[size])
+
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        return cls.sizes[size]
+
+    stages = ["Total", "IO", "Parse", "Traverse", "Serialize"]
+
+    linear_scales = {
+        "Total": True,
+        "IO": True,
+        "Parse": True,
+        "Traverse": True,
+        "Serialize": True,
+    }
+
+    @classmethod
+    def benchmark_args(cls, size):
+        return [cls._datafile[size]]
+
+    @classmethod
+    def ensure_data_exists(cls):
+        generators.ensure_datasets([
+            (f, generators.generate_json, {"num_records": cls.sizes[size], "max_depth": 3, "fanout": 3})
+            for size, f in sorted(cls._datafile.iteritems())
+        ])
+
+    @classmethod
+    def result_extractor(cls, runs):
+        result = default_runtime_extractor(
+            runs,
+            cls.stages[1:],
+            cls.size_ladder,
+            add_total_stage=True
+        )
+        return result
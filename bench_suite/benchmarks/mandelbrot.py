@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import textwrap
+
+from ..base import Sizes, default_runtime_extractor, ThroughputMetric
+
+
+# grid (width, height) of the regular sizes, the complex plane region is always the same
+_grids = {
+    Sizes.S: (250, 250),
+    Sizes.M: (500, 500),
+    Sizes.L: (1000, 1000),
+}
+
+# weak scaling size: every worker adds this many rows to the grid (4 workers give size L)
+_weak_size = "W"
+_weak_grid_per_worker = (1000, 250)
+
+
+def _megapixels(size):
+    width, height = _grids[size]
+    return width * height / 1e6
+
+
+class Mandelbrot(object):
+
+    title = "Mandelbrot"
+
+    description = textwrap.dedent("""\
+    Compute the escape times of the Mandelbrot iteration on a grid of points, distributing
+    the work over a given number of workers (threads or processes). Rules:
+
+    - The rows of the grid have to be distributed over the workers, e.g., interleaved.
+      The stage times must include the communication of the results.
+    - With a single worker, implementations may run in-process, but should use
+      the same code path as with multiple workers.
+
+    The point in column x and row y of a grid of size width x height is
+
+        c = (-2.0 + 2.5 * x / width) + (-1.25 + 2.5 * y / height) i
+
+    Its escape time is the index i (0-based) of the first iteration of
+    z = z * z + c (starting at z = 0) with |z|^2 > 4.0, or max_iterations if
+    |z|^2 stays below 4.0 for all max_iterations iterations.
+
+    The benchmark is divided into two stages:
+
+    - **Compute**: Compute the escape times of all points in parallel, and collect them in the main thread/process.
+    - **Histogram**: Count the occurrences of all escape times 0 .. max_iterations (sequentially).
+
+    Benchmark aspects: Parallelism (strong and weak scaling), inter-process communication, floating point arithmetic
+
+    <div class="page-header"></div>
+    #### Input
+
+    1. Argument: Width of the grid
+    2. Argument: Height of the grid
+    3. Argument: Maximum number of iterations
+    4. Argument: Number of workers
+
+    Regular runs use a single worker. Thread sweeps (`--threads`) run size L with a fixed grid
+    (strong scaling), and size W, whose height grows with the number of workers (weak scaling).
+
+    <div class="page-header"></div>
+    #### Control Output
+
+    After writing the stage run times to STDOUT, the implementations should print:
+
+    - Number of points with escape time max_iterations (i.e., considered part of the set)
+    - Sum of all escape times
+
+    """)
+
+    size_ladder = list(Sizes)
+
+    max_iterations = 100
+
+    size_quantity = "Number of points"
+
+    @classmethod
+    def size_description(cls, size):
+        if size == _weak_size:
+            return "{} x {} * workers".format(*_weak_grid_per_worker)
+        return "{} x {}".format(*_grids[size])
+
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        width, height = _grids[size]
+        return width * height
+
+    stages = ["Total", "Compute", "Histogram"]
+
+    linear_scales = {
+        "Total": False,
+        "Compute": False,
+        "Histogram": False,
+    }
+
+    throughput_metrics = {
+        "Compute": ThroughputMetric("Mpixel/s", _megapixels),
+    }
+
+    # the number of workers is passed as argument, see benchmark_args
+    thread_count_arg = True
+    thread_scaling_stage = "Compute"
+    thread_sweep_sizes = [Sizes.L, _weak_size]
+    weak_scaling_sizes = [_weak_size]
+
+    timeouts = {
+        Sizes.S: 60,
+        Sizes.M: 240,
+        Sizes.L: 900,
+        _weak_size: 900,
+    }
+
+    @classmethod
+    def benchmark_args(cls, size, threads=1):
+        if size == _weak_size:
+            width, height = _weak_grid_per_worker[0], _weak_grid_per_worker[1] * threads
+        else:
+            width, height = _grids[size]
+        return [str(width), str(height), str(cls.max_iterations), str(threads)]
+
+    @classmethod
+    def ensure_data_exists(cls):
+        pass
+
+    @classmethod
+    def result_extractor(cls, runs):
+        # the weak scaling size is only part of thread sweeps
+        result = default_runtime_extractor(
+            runs,
+            cls.stages[1:],
+            cls.size_ladder + [_weak_size],
+            add_total_stage=True
+        )
+        return result
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import textwrap
+import os
+
+from ..base import Sizes, default_runtime_extractor, ThroughputMetric
+from .. import generators
+
+
+_orders = ["random", "sorted", "reversed"]
+
+_num_ints = {
+    Sizes.S: 250 * 1000,
+    Sizes.M: 1000 * 1000,
+    Sizes.L: 4000 * 1000,
+}
+
+_num_strings = {
+    Sizes.S: 100 * 1000,
+    Sizes.M: 400 * 1000,
+    Sizes.L: 1600 * 1000,
+}
+
+
+def _million_ints(size):
+    return _num_ints[size] / 1e6
+
+
+def _million_strings(size):
+    return _num_strings[size] / 1e6
+
+
+class Sort(object):
+
+    title = "Sort"
+
+    description = textwrap.dedent("""\
+    Sort arrays of 64 bit integers and of strings, each in three variants: in random order,
+    already sorted, and sorted in reverse order. Every variant is an individual input file,
+    and has to be sorted individually (ascending, strings by byte-wise comparison),
+    even though the sorted variants contain the same values as the random one.
+
+    The benchmark is divided into seven stages:
+
+    - **IO**: Read all six input files into arrays.
+    - **Sort ints**, **Sort ints (sorted)**, **Sort ints (reversed)**: Sort the integer arrays.
+    - **Sort strings**, **Sort strings (sorted)**, **Sort strings (reversed)**: Sort the string arrays.
+
+    Benchmark aspects: Memory bandwidth, comparisons, adaptivity of the sorting algorithm to presorted input
+
+    <div class="page-header"></div>
+    #### Input
+
+    1. - 3. Argument: Paths of the integer files (random, sorted, reversed order), containing
+       raw little-endian int64 values (non-negative, i.e., the file size divided by 8 values).
+    4. - 6. Argument: Paths of the string files (random, sorted, reversed order), containing
+       lowercase strings, each terminated by `'\\n'`.
+
+    <div class="page-header"></div>
+    #### Control Output
+
+    After writing the stage run times to STDOUT, the implementations should print a checksum
+    of each of the six sorted arrays (in the order of the stages), computed over the 100 sampled
+    positions `i * n / 100` (integer division) for i = 0 .. 99, where n is the length of the array:
+
+        checksum = 0
+        for each sampled integer v:
+            checksum = (checksum + v % 2147483647) % 2147483647
+        for each sampled string, for each byte b of the string:
+            checksum = (checksum * 31 + b) % 2147483647
+
+    """)
+
+    size_ladder = list(Sizes)
+
+    _int_files = {
+        (size, order): os.path.abspath("data/generated/int64_{}_{}.bin".format(order, size))
+        for size in Sizes
+        for order in _orders
+    }
+
+    _string_files = {
+        (size, order): os.path.abspath("data/generated/strings_{}_{}.txt".format(order, size))
+        for size in Sizes
+        for order in _orders
+    }
+
+    size_quantity = "Number of values"
+
+    @classmethod
+    def size_description(cls, size):
+        return "{:,} ints, {:,} strings".format(_num_ints[size], _num_strings[size])
+
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        if stage is not None and stage.startswith("Sort strings"):
+            return _num_strings[size]
+        return _num_ints[size]
+
+    stages = [
+        "Total", "IO",
+        "Sort ints", "Sort ints (sorted)", "Sort ints (reversed)",
+        "Sort strings", "Sort strings (sorted)", "Sort strings (reversed)",
+    ]
+
+    linear_scales = {
+        "Total": False,
+        "IO": True,
+        "Sort ints": False,
+        "Sort ints (sorted)": False,
+        "Sort ints (reversed)": False,
+        "Sort strings": False,
+        "Sort strings (sorted)": False,
+        "Sort strings (reversed)": False,
+    }
+
+    throughput_metrics = {
+        "Sort ints": ThroughputMetric("M ints/s", _million_ints),
+        "Sort ints (sorted)": ThroughputMetric("M ints/s", _million_ints),
+        "Sort ints (reversed)": ThroughputMetric("M ints/s", _million_ints),
+        "Sort strings": ThroughputMetric("M strings/s", _million_strings),
+        "Sort strings (sorted)": ThroughputMetric("M strings/s", _million_strings),
+        "Sort strings (reversed)": ThroughputMetric("M strings/s", _million_strings),
+    }
+
+    @classmethod
+    def benchmark_args(cls, size):
+        return [cls._int_files[(size, order)] for order in _orders] + \
+               [cls._string_files[(size, order)] for order in _orders]
+
+    @classmethod
+    def ensure_data_exists(cls):
+        # the sorted variants contain the same values as the random one
+        datasets = []
+        for size in Sizes:
+            int_seed = generators.dataset_seed(cls._int_files[(size, "random")])
+            string_seed = generators.dataset_seed(cls._string_files[(size, "random")])
+            for order in _orders:
+                datasets += [
+                    (cls._int_files[(size, order)], generators.generate_int64_array,
+                     {"num_values": _num_ints[size], "order": order, "seed": int_seed}),
+                    (cls._string_files[(size, order)], generators.generate_strings,
+                     {"num_strings": _num_strings[size], "order": order, "seed": string_seed}),
+                ]
+        generators.ensure_datasets(datasets)
+
+    @classmethod
+    def result_extractor(cls, runs):
+        result = default_runtime_extractor(
+            runs,
+            cls.stages[1:],
+            cls.size_ladder,
+            add_total_stage=True
+        )
+        return result
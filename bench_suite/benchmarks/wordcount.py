@@ -5,11 +5,19 @@ from __future__ import division, print_function
 import textwrap
 import os
 
-from ..base import Sizes, default_runtime_extractor
-from ..utils import print_warn
+from ..base import log_spaced_sizes, default_runtime_extractor, ThroughputMetric
 from .. import generators
 
 
+# log-spaced file sizes from ~1 MB to ~100 MB, labelled by their size in MB
+_file_sizes = log_spaced_sizes(1 * 1024 * 1024, 100 * 1024 * 1024, 5)
+_size_ladder = ["{:.0f}MB".format(num_bytes / 1024 / 1024) for num_bytes in _file_sizes]
+
+
+def _file_size_mb(size):
+    return dict(zip(_size_ladder, _file_sizes))[size] / 1024 / 1024
+
+
 class Wordcount(object):
 
     title = "Wordcount"
@@ -39,21 +47,24 @@ class Wordcount(object):
 
     """)
 
+    size_ladder = _size_ladder
+
     _datafile = {
-        Sizes.S: os.path.abspath("data/generated/random_words_S.txt"),
-        Sizes.M: os.path.abspath("data/generated/random_words_M.txt"),
-        Sizes.L: os.path.abspath("data/generated/random_words_L.txt"),
+        size: os.path.abspath("data/generated/random_words_{}.txt".format(size))
+        for size in _size_ladder
     }
 
-    sizes = {
-        Sizes.S:   1 * 1024 * 1024,
-        Sizes.M:  10 * 1024 * 1024,
-        Sizes.L: 100 * 1024 * 1024,
-    }
+    sizes = dict(zip(_size_ladder, _file_sizes))
+
+    size_quantity = "File size [bytes]"
 
     @classmethod
     def size_description(cls, size):
-        return "file size = ~{} MB".format(cls.sizes[size] / 1024 / 1024)
+        return "file size = ~{:.1f} MB".format(cls.sizes[size] / 1024 / 1024)
+
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        return cls.sizes[size]
 
     stages = ["Total", "IO", "Split", "Count"]
 
@@ -64,24 +75,31 @@ class Wordcount(object):
         "Count": True,
     }
 
+    # all stages process the entire file
+    throughput_metrics = {
+        "Total": ThroughputMetric("MB/s", _file_size_mb),
+        "IO": ThroughputMetric("MB/s", _file_size_mb),
+        "Split": ThroughputMetric("MB/s", _file_size_mb),
+        "Count": ThroughputMetric("MB/s", _file_size_mb),
+    }
+
     @classmethod
     def benchmark_args(cls, size):
         return [cls._datafile[size]]
 
     @classmethod
     def ensure_data_exists(cls):
-        for size, f in cls._datafile.iteritems():
-            if not os.path.exists(f):
-                print_warn(
-                    " *** Generating data [{}], this might take a while...".format(f)
-                )
-                generators.generate_text(f, cls.sizes[size])
+        generators.ensure_datasets([
+            (f, generators.generate_text, {"chars_to_write": cls.sizes[size]})
+            for size, f in sorted(cls._datafile.iteritems())
+        ])
 
     @classmethod
-    def result_extractor(cls, b_entry):
+    def result_extractor(cls, runs):
         result = default_runtime_extractor(
-            b_entry,
+            runs,
             cls.stages[1:],
+            cls.size_ladder,
             add_total_stage=True
         )
         return result
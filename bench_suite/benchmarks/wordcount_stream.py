@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import textwrap
+import os
+
+from ..base import default_runtime_extractor, ThroughputMetric
+from .. import generators
+from .wordcount import Wordcount
+
+
+# the two smaller sizes are those of the Wordcount benchmark (sharing its files),
+# the larger ones do not fit into the memory of typical machines once split into words
+_file_sizes = [
+    Wordcount.sizes["10MB"],
+    Wordcount.sizes["100MB"],
+    512 * 1024 * 1024,
+    2048 * 1024 * 1024,
+]
+_size_ladder = ["{:.0f}MB".format(num_bytes / 1024 / 1024) for num_bytes in _file_sizes]
+
+# the file is read in chunks of this many bytes
+_chunk_size = 1024 * 1024
+
+
+def _file_size_mb(size):
+    return dict(zip(_size_ladder, _file_sizes))[size] / 1024 / 1024
+
+
+class WordcountStream(object):
+
+    title = "Wordcount (Streaming)"
+
+    description = textwrap.dedent("""\
+    Perform the same word count as the Wordcount benchmark, but with constant memory:
+    instead of reading the entire file into one string, the file has to be processed
+    in chunks of a fixed number of bytes, i.e., reading, splitting (on `'\\n'` and `' '`),
+    and counting are interleaved. Words crossing the boundary of two chunks have to be
+    carried over to the next chunk. At no time should more than one chunk (plus the
+    carried over word) of the file be held in memory.
+
+    Since the stages are interleaved, there is only a single stage:
+
+    - **Stream**: Read, split, and count the entire file.
+
+    The peak RSS recorded for every run shows whether an implementation actually works
+    in constant memory: it should not grow with the file size (the number of distinct
+    words is bounded). The largest file exceeds the memory of many machines.
+
+    Benchmark aspects: Buffered IO, hash maps, basic string operations, memory footprint
+
+    <div class="page-header"></div>
+    #### Input
+
+    1. Argument: Path of text file to read.
+    2. Argument: Chunk size in bytes.
+
+    <div class="page-header"></div>
+    #### Control Output
+
+    After writing the stage run times to STDOUT, the implementations should print:
+
+    - Size of the word map
+    - Sum of the counts in the map
+
+    """)
+
+    size_ladder = _size_ladder
+
+    # same file names (and generator parameters) as the Wordcount benchmark
+    _datafile = {
+        size: os.path.abspath("data/generated/random_words_{}.txt".format(size))
+        for size in _size_ladder
+    }
+
+    sizes = dict(zip(_size_ladder, _file_sizes))
+
+    size_quantity = "File size [bytes]"
+
+    # interpreted languages process a few MB/s, the timeouts grow linearly with the file size
+    timeouts = {
+        size: int(max(60, num_bytes / 1024 / 1024))
+        for size, num_bytes in zip(_size_ladder, _file_sizes)
+    }
+
+    @classmethod
+    def size_description(cls, size):
+        return "file size = ~{:.1f} MB".format(cls.sizes[size] / 1024 / 1024)
+
+    @classmethod
+    def size_magnitude(cls, size, stage=None):
+        return cls.sizes[size]
+
+    stages = ["Total", "Stream"]
+
+    linear_scales = {
+        "Total": True,
+        "Stream": True,
+    }
+
+    throughput_metrics = {
+        "Total": ThroughputMetric("MB/s", _file_size_mb),
+        "Stream": ThroughputMetric("MB/s", _file_size_mb),
+    }
+
+    @classmethod
+    def benchmark_args(cls, size):
+        return [cls._datafile[size], str(_chunk_size)]
+
+    @classmethod
+    def ensure_data_exists(cls):
+        generators.ensure_datasets([
+            (f, generators.generate_text, {"chars_to_write": cls.sizes[size]})
+            for size, f in sorted(cls._datafile.iteritems())
+        ])
+
+    @classmethod
+    def result_extractor(cls, runs):
+        result = default_runtime_extractor(
+            runs,
+            cls.stages[1:],
+            cls.size_ladder,
+            add_total_stage=True
+        )
+        return result
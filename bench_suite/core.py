@@ -3,36 +3,70 @@
 from __future__ import division, print_function
 
 import re
+import sys
 import glob
 import subprocess
 import time
 import random
 import datetime
+import threading
+import Queue
+import multiprocessing
+import tempfile
+from StringIO import StringIO
+from collections import OrderedDict
 
 import numpy as np
 import yaml
 import markdown
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+import json
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, StrictUndefined
 
 from .benchmarks.basicmatops import BasicMatOps
 from .benchmarks.fibonacci import Fibonacci
 from .benchmarks.wordcount import Wordcount
+from .benchmarks.mandelbrot import Mandelbrot
+from .benchmarks.jsonparse import Json
+from .benchmarks.sort import Sort
+from .benchmarks.wordcount_stream import WordcountStream
 
 from .utils import *
-from .base import Sizes
-from .specs import get_system_specs, get_software_specs
+from .base import get_size_ladder, get_largest_size, get_throughput_metric, overhead_stage, timeout_stage, resource_metrics, resource_metric_units, \
+    read_stage_runtimes, get_timeout, get_benchmark_args, get_thread_sweep_sizes, is_weak_scaling_size
+from .manifest import RunManifest, RenderManifest
+from .history import compare_sessions
+from .store import ResultStore, import_result_files, entry_key
+from .stats import relative_ci_width, summarize, outlier_mask, rank_ranges, fit_power_law
+from .affinity import allocate_cpu_sets, cpu_set_to_str, get_physical_cores
+from .noise import run_noise_check, SystemSampler, exclude_throttled_runs
+from . import launcher
+from .specs import get_system_specs, get_software_specs, get_toolchain_version
 
 
 benchmark_meta = {
     "Wordcount": Wordcount,
     "BasicMatOps": BasicMatOps,
     "Fibonacci": Fibonacci,
+    "Mandelbrot": Mandelbrot,
+    "Json": Json,
+    "Sort": Sort,
+    "WordcountStream": WordcountStream,
 }
 
+# Maximum number of bytes of STDOUT/STDERR shown on the console for each run
+max_console_output = 10 * 1024
+
+# Environment variables limiting the threads of OpenMP and the BLAS libraries
+thread_env_vars = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"]
+
 benchmark_id = {
     "Wordcount": 1,
     "BasicMatOps": 2,
     "Fibonacci": 3,
+    "Mandelbrot": 4,
+    "Json": 5,
+    "Sort": 6,
+    "WordcountStream": 7,
 }
 
 
@@ -40,6 +74,12 @@ class Paths(object):
 
     templates = "templates"
     html = "docs"
+    results = "results"
+    run_manifest = os.path.join(results, "run_manifest.jsonl")
+    result_store = os.path.join(results, "results.db")
+    cache = ".cache"
+    template_cache = os.path.join(cache, "templates")
+    render_manifest = os.path.join(cache, "render_manifest.yml")
 
     @staticmethod
     def html_benchmark(benchmark_name):
@@ -62,6 +102,20 @@ class Paths(object):
             "stage_summary.csv",
         )
 
+    @staticmethod
+    def html_scaling_csv(benchmark_name):
+        return os.path.join(
+            Paths.html_benchmark(benchmark_name),
+            "scaling.csv",
+        )
+
+    @staticmethod
+    def html_thread_scaling_csv(benchmark_name):
+        return os.path.join(
+            Paths.html_benchmark(benchmark_name),
+            "thread_scaling.csv",
+        )
+
 
 class BenchmarkEntry(object):
 
@@ -92,22 +146,63 @@ class BenchmarkEntry(object):
             "{:02d}_{}".format(self.impl_id, self.impl_name)
         )
 
+    def result_file(self, size, run_id, threads=1):
+        # runs of thread sweeps are kept apart from the regular (single-threaded) runs
+        result_path = self.result_path
+        if threads != 1:
+            result_path = os.path.join(result_path, "threads_{}".format(threads))
+        return os.path.join(result_path, "stdout_run_{}_{:04d}".format(size, run_id))
+
     def result_files(self, size):
         pattern = os.path.join(self.result_path, "stdout_run_{}_*".format(size))
         return sorted(glob.glob(pattern))
 
+    @property
+    def source_commit(self):
+        """ Commit of the last change of the implementation (see get_git_commit). """
+        if not hasattr(self, "_source_commit"):
+            self._source_commit = get_git_commit(self.impl_path)
+        return self._source_commit
+
     @property
     def impl_suffix(self):
         fields = self.impl_name.split("_")
         return ", ".join(fields)
 
-    def build(self):
+    @property
+    def build_hash_path(self):
+        return os.path.join(self.impl_path, ".build_hash")
+
+    def compute_build_hash(self):
+        """
+        Content hash of everything that affects the build: all (non-ignored) files of
+        the implementation directory, the shared source file, and the toolchain version.
+        """
+        input_files = [
+            fn for fn in list_source_files(self.impl_path)
+            if fn != self.build_hash_path
+        ]
+        source_file = self.meta_data.get("source-file") if self.meta_data else None
+        if source_file is not None:
+            source_path = os.path.normpath(os.path.join(self.impl_path, source_file))
+            if source_path not in input_files:
+                input_files.append(source_path)
+        return hash_files(input_files, [get_toolchain_version(self.language)])
+
+    def build(self, use_cache=True):
+        """ Builds the implementation and returns whether the build was successful. """
 
         build_script_path = os.path.join(
             self.impl_path, "build.sh"
         )
         if not os.path.exists(build_script_path):
-            return
+            return True
+
+        build_hash = self.compute_build_hash()
+        if use_cache and os.path.exists(self.build_hash_path):
+            if read_file(self.build_hash_path).strip() == build_hash:
+                print("Build is up-to-date [{}]".format(build_hash[:10]))
+                return True
 
         p = subprocess.Popen(
             [
@@ -126,7 +221,6 @@ class BenchmarkEntry(object):
             )
             print(stderr)
 
-        # TODO: add switch for making build failures fatal
         print("Return code: {}".format(p.returncode))
         if p.returncode != 0:
             print_error(
@@ -134,43 +228,134 @@ class BenchmarkEntry(object):
             )
             print("STDOUT:\n" + stdout)
             print("STDERR:\n" + stderr)
-            import sys; sys.exit(1)
+            if os.path.exists(self.build_hash_path):
+                os.remove(self.build_hash_path)
+            return False
+
+        write_file(self.build_hash_path, build_hash + "\n")
+        return True
+
+    def run(self, args, stdout_filename, cpus=None, timeout=None, threads=1):
+        """
+        Runs the implementation, streaming its STDOUT directly into the given file.
+        Runs exceeding the timeout (in seconds) are killed along with their entire
+        process group. OpenMP and BLAS libraries are limited to the given number of
+        threads. Returns the meta data of the run, including its status
+        ("ok", "failed", or "timeout").
+        """
+        rusage_filename = stdout_filename + ".rusage"
+        ensure_dir_exists(rusage_filename)
+
+        # The launcher reports the resource usage of the run script (see launcher.py)
+        command = [
+            sys.executable,
+            launcher.launcher_path,
+            os.path.abspath(rusage_filename),
+            "/bin/bash",
+            "run.sh"
+        ] + args
+        if cpus is not None:
+            command = ["taskset", "-c", cpu_set_to_str(cpus)] + command
 
-    def run(self, args, stdout_filename):
-        p = subprocess.Popen(
-            [
-                "/bin/bash",
-                "run.sh"
-            ] + args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self.impl_path
-        )
-        stdout, stderr = p.communicate()
+        out_path = stdout_filename
+        ensure_dir_exists(out_path)
 
-        print("Return code: {}".format(p.returncode))
-        if p.returncode != 0:
-            print_error(
-                "Run has failed with return code {}.".format(p.returncode)
+        env = dict(os.environ)
+        for var in thread_env_vars:
+            env[var] = str(threads)
+
+        with open(out_path, "w") as stdout_file, tempfile.TemporaryFile() as stderr_file:
+            p = subprocess.Popen(
+                command,
+                stdout=stdout_file,
+                stderr=stderr_file,
+                cwd=self.impl_path,
+                env=env,
+                preexec_fn=os.setsid,
             )
-            print("STDOUT:\n" + stdout)
-            print("STDERR:\n" + stderr)
+            timed_out = wait_with_timeout(p, timeout)
+
+            stderr_file.seek(0)
+            stderr = stderr_file.read(max_console_output)
+
+        stdout = read_file(out_path)[:max_console_output]
+
+        with console_lock:
+            print("Return code: {}".format(p.returncode))
+            if timed_out:
+                print_error(
+                    "Run has been killed after exceeding the timeout of {} sec.".format(timeout)
+                )
+                print("STDOUT:\n" + stdout)
+                print("STDERR:\n" + stderr)
+
+            elif p.returncode != 0:
+                print_error(
+                    "Run has failed with return code {}.".format(p.returncode)
+                )
+                print("STDOUT:\n" + stdout)
+                print("STDERR:\n" + stderr)
+
+            elif len(stderr) > 0:
+                print_error(
+                    "Run has return code 0, but returned on STDERR."
+                )
+                print("STDOUT:\n" + stdout)
+                print("STDERR:\n" + stderr)
+
+            else:
+                print("Read stdout of length: {}".format(os.path.getsize(out_path)))
+                print(stdout)
+
+        resource_usage = launcher.read_resource_usage(rusage_filename)
+        if os.path.exists(rusage_filename):
+            os.remove(rusage_filename)
+
+        # wall time as measured by the launcher, i.e., without its own startup
+        wall_time = resource_usage.pop("wall_time") if resource_usage is not None else None
+
+        if timed_out:
+            status = "timeout"
+        elif p.returncode != 0:
+            status = "failed"
+        else:
+            status = "ok"
+
+        run_meta = {
+            "cpus": cpus,
+            "threads": threads,
+            "status": status,
+            "timeout": timeout,
+            "return_code": p.returncode,
+            "wall_time": wall_time,
+            "resource_usage": resource_usage,
+            "finished": datetime.datetime.now().isoformat(),
+        }
+        return run_meta
 
-        elif len(stderr) > 0:
-            print_error(
-                "Run has return code 0, but returned on STDERR."
-            )
-            print("STDOUT:\n" + stdout)
-            print("STDERR:\n" + stderr)
+    @property
+    def timeouts(self):
+        """
+        Timeout(s) from benchmark.yml, either a number of seconds for all sizes,
+        or a dict "size => seconds".
+        """
+        if self.meta_data is None:
+            return None
+        return self.meta_data.get("timeout")
 
-        else:
-            print("Read stdout of length: {}".format(len(stdout)))
-            print(stdout)
+    @property
+    def multithreaded(self):
+        """ Whether benchmark.yml declares the entry as multithreaded, i.e., as part of thread sweeps. """
+        if self.meta_data is None:
+            return False
+        return bool(self.meta_data.get("multithreaded", False))
 
-        out_path = stdout_filename
-        ensure_dir_exists(out_path)
-        f = open(out_path, "w")
-        f.write(stdout)
+    @property
+    def input_format(self):
+        """ Input format from benchmark.yml, or None for the default format of the benchmark. """
+        if self.meta_data is None:
+            return None
+        return self.meta_data.get("input-format")
 
     def _load_meta_data(self):
         path = os.path.join(self.impl_path, "benchmark.yml")
@@ -252,7 +437,10 @@ def filter_benchmark_entries(entries, langs, benchmarks):
 # Benchmark running
 # -----------------------------------------------------------------------------
 
-def run_all_benchmarks(benchmark_entries, num_repetitions):
+def run_all_benchmarks(benchmark_entries, num_repetitions, num_jobs=1, num_build_jobs=None, use_build_cache=True, resume=False, adaptive=None, default_timeout=None, noise_check="warn", thread_counts=None):
+
+    # checked first, data generation and builds would add load themselves
+    run_noise_check(noise_check)
 
     # data generation
     benchmark_names = set([b_entry.benchmark_name for b_entry in benchmark_entries])
@@ -262,7 +450,7 @@ def run_all_benchmarks(benchmark_entries, num_repetitions):
         ))
 
         # check data
-        b_meta_data = benchmark_meta[b_entry.benchmark_name]
+        b_meta_data = benchmark_meta[benchmark_name]
 
         t1 = time.time()
         b_meta_data.ensure_data_exists()
@@ -270,50 +458,463 @@ def run_all_benchmarks(benchmark_entries, num_repetitions):
         print("[{:6.1f} sec]".format(t2 - t1))
 
     # build
+    # Entries of the same benchmark and language share their parent directory, and
+    # their build scripts may share sources and caches there (e.g., ../nimcache),
+    # so only entries of different directories are built in parallel.
+    build_groups = OrderedDict()
     for b_entry in benchmark_entries:
-        print_bold("\nBuilding: {} / {} / {}".format(
-            b_entry.language, b_entry.benchmark_name, b_entry.impl_name,
+        build_groups.setdefault(os.path.dirname(b_entry.impl_path), []).append(b_entry)
+
+    build_failed = False
+    pool = multiprocessing.Pool(num_build_jobs)
+    try:
+        group_results = pool.imap(build_entries, [(group, use_build_cache) for group in build_groups.values()])
+        for group, build_results in zip(build_groups.values(), group_results):
+            for b_entry, (success, build_log, build_time) in zip(group, build_results):
+                print_bold("\nBuilding: {} / {} / {}".format(
+                    b_entry.language, b_entry.benchmark_name, b_entry.impl_name,
+                ))
+                print(build_log, end="")
+                print("[{:6.1f} sec]".format(build_time))
+                build_failed |= not success
+    finally:
+        pool.close()
+        pool.join()
+
+    # TODO: add switch for making build failures non-fatal
+    if build_failed:
+        print_error("Aborting because of build failures.")
+        sys.exit(1)
+
+    # run
+    # In parallel mode every worker gets its own dedicated core(s), in sequential
+    # mode the runs are not pinned at all.
+    if num_jobs > 1:
+        cpu_sets = allocate_cpu_sets(num_jobs)
+    else:
+        cpu_sets = [None]
+
+    manifest = RunManifest(Paths.run_manifest)
+    store = ResultStore(Paths.result_store)
+    # an interrupted session is continued when resuming
+    if resume:
+        session_id = store.resume_session(get_git_commit(), get_software_specs())
+    else:
+        session_id = store.start_session(get_git_commit(), get_software_specs())
+    print_bold("\nBenchmark session: {}".format(session_id))
+
+    if adaptive is None:
+        runs = [
+            (b, size, run_id, 1)
+            for b in benchmark_entries
+            for size in get_size_ladder(benchmark_meta[b.benchmark_name])
+            for run_id in xrange(1, num_repetitions+1)
+        ]
+        # Maybe we want to shuffle only w.r.t language/run_id and keep sizes in order?
+        random.shuffle(runs)
+        execute_runs(runs, cpu_sets, manifest, store, resume, default_timeout)
+        for b_entry in benchmark_entries:
+            for size in get_size_ladder(benchmark_meta[b_entry.benchmark_name]):
+                discard_surplus_runs(store, b_entry, size, 1, num_repetitions)
+    else:
+        run_adaptively(benchmark_entries, adaptive, cpu_sets, manifest, store, resume, default_timeout)
+
+    if thread_counts is not None:
+        num_sweep_repetitions = num_repetitions if adaptive is None else adaptive.min_repetitions
+        run_thread_sweep(benchmark_entries, thread_counts, num_sweep_repetitions, manifest, store, resume, default_timeout)
+    store.close()
+    manifest.close()
+
+
+def discard_surplus_runs(store, b_entry, size, threads, num_runs):
+    """
+    Removes the runs of a cell beyond the number of runs of this session (along with
+    their output files), so that left-overs of earlier sessions do not enter the statistics.
+    """
+    store.delete_runs_after(b_entry, size, threads, num_runs)
+    run_id = num_runs + 1
+    while os.path.exists(b_entry.result_file(size, run_id, threads)):
+        os.remove(b_entry.result_file(size, run_id, threads))
+        run_id += 1
+
+
+def run_thread_sweep(benchmark_entries, thread_counts, num_repetitions, manifest, store, resume, default_timeout):
+    """
+    Repeats the thread sweep sizes (by default the largest size) of all multithreaded
+    entries with the given numbers of threads. The runs of a thread count are pinned to
+    as many dedicated physical cores, if available, and are executed one at a time.
+    The single-threaded baseline is measured the same way, i.e., for sizes of the ladder
+    the regular runs are repeated pinned (replacing them), since they may have been
+    unpinned or concurrent to other runs.
+    """
+    entries = [b_entry for b_entry in benchmark_entries if b_entry.multithreaded]
+    if len(entries) == 0:
+        print_warn("No multithreaded entries (multithreaded: true in benchmark.yml), skipping the thread sweep.")
+        return
+
+    num_cores = len(get_physical_cores())
+    for threads in sorted(set(thread_counts) | set([1])):
+        runs = []
+        for b_entry in entries:
+            meta_data = benchmark_meta[b_entry.benchmark_name]
+            for size in get_thread_sweep_sizes(meta_data):
+                runs += [(b_entry, size, run_id, threads) for run_id in xrange(1, num_repetitions+1)]
+
+        print_bold("\nThread sweep: {} threads".format(threads))
+        if threads <= num_cores:
+            cpu_sets = allocate_cpu_sets(1, threads)
+        else:
+            print_warn("Only {} physical cores available, running {} threads unpinned.".format(num_cores, threads))
+            cpu_sets = [None]
+        random.shuffle(runs)
+
+        if threads == 1:
+            # regular runs share their key with the baseline, so they would be skipped
+            # when resuming, only runs measured under the conditions of the sweep count
+            if resume:
+                runs = [run for run in runs if not is_sweep_baseline(store, run, cpu_sets[0])]
+            execute_runs(runs, cpu_sets, manifest, store, False, default_timeout)
+        else:
+            execute_runs(runs, cpu_sets, manifest, store, resume, default_timeout)
+        for b_entry in entries:
+            for size in get_thread_sweep_sizes(benchmark_meta[b_entry.benchmark_name]):
+                discard_surplus_runs(store, b_entry, size, threads, num_repetitions)
+
+
+def is_sweep_baseline(store, run, cpus):
+    """ Checks whether a single-threaded run has a valid result which was measured pinned to cpus, without concurrent runs. """
+    b_entry, size, run_id, threads = run
+    return any(
+        stored_run["size"] == size and stored_run["run_id"] == run_id and stored_run["threads"] == threads and
+        stored_run["status"] == "ok" and stored_run.get("cpus") == cpus and stored_run.get("jobs") == 1
+        for stored_run in store.load_runs(b_entry)[entry_key(b_entry)]
+    )
+
+
+class AdaptiveRepetitions(object):
+    """
+    Settings for adaptive repetitions: Each (entry, size) cell is repeated until the
+    confidence interval of the median total run time is narrower than the given
+    fraction of the median, or until the maximum number of repetitions is reached.
+    The confidence interval needs at least two runs.
+    """
+
+    def __init__(self, target_ci_width=0.05, min_repetitions=5, max_repetitions=30):
+        self.target_ci_width = target_ci_width
+        self.min_repetitions = max(2, min_repetitions)
+        self.max_repetitions = max_repetitions
+
+
+def run_adaptively(benchmark_entries, adaptive, cpu_sets, manifest, store, resume, default_timeout):
+
+    cells = [
+        (b_entry, size)
+        for b_entry in benchmark_entries
+        for size in get_size_ladder(benchmark_meta[b_entry.benchmark_name])
+    ]
+    num_runs = {cell: 0 for cell in cells}
+    ci_widths = {cell: float("inf") for cell in cells}
+
+    pending_cells = cells
+    round_id = 0
+    while len(pending_cells) > 0:
+        round_id += 1
+
+        runs = []
+        cells_of_round = pending_cells
+        for cell in pending_cells:
+            b_entry, size = cell
+            num_new_runs = adaptive.min_repetitions if num_runs[cell] == 0 else 1
+            runs += [
+                (b_entry, size, num_runs[cell] + i, 1)
+                for i in xrange(1, num_new_runs + 1)
+            ]
+            num_runs[cell] += num_new_runs
+        random.shuffle(runs)
+
+        print_bold("\nAdaptive round {}: {} runs for {} unconverged cells".format(
+            round_id, len(runs), len(pending_cells)
         ))
+        execute_runs(runs, cpu_sets, manifest, store, resume, default_timeout)
+
+        timed_out_cells = set()
+        for cell in pending_cells:
+            b_entry, size = cell
+            b_meta_data = benchmark_meta[b_entry.benchmark_name]
+            entry_runs = [
+                run for run in store.load_runs(b_entry)[entry_key(b_entry)]
+                if run["size"] == size and run["run_id"] <= num_runs[cell] and run["threads"] == 1
+            ]
+            if any(run["status"] == "timeout" for run in entry_runs):
+                timed_out_cells.add(cell)
+            entry_runs = [run for run in entry_runs if not run.get("throttled", False)]
+            total_runtimes = b_meta_data.result_extractor(entry_runs)["Total"][size]
+            ci_widths[cell] = relative_ci_width(total_runtimes)
+
+        # cells with timeouts are not repeated further, more runs would only time out again
+        pending_cells = [
+            cell for cell in pending_cells
+            if ci_widths[cell] > adaptive.target_ci_width and
+            num_runs[cell] < adaptive.max_repetitions and
+            cell not in timed_out_cells
+        ]
+        for cell in set(cells_of_round) - set(pending_cells):
+            b_entry, size = cell
+            discard_surplus_runs(store, b_entry, size, 1, num_runs[cell])
+
+    print_bold("\nNumber of runs per cell (target CI width: {:.1f} %):".format(
+        adaptive.target_ci_width * 100
+    ))
+    for b_entry, size in cells:
+        print("{} / {} / {} / {}: {:3d} runs, CI width: {:.1f} %".format(
+            b_entry.language, b_entry.benchmark_name, b_entry.impl_name, size,
+            num_runs[(b_entry, size)], ci_widths[(b_entry, size)] * 100
+        ))
+
+
+def execute_runs(runs, cpu_sets, manifest, store, resume, default_timeout):
+
+    manifest.add_planned(runs)
+
+    if resume:
+        pending_runs = []
+        for b_entry, size, run_id, threads in runs:
+            # timed out runs are considered as completed, they would only time out again
+            if store.get_status(b_entry, size, run_id, threads) in ["ok", "timeout"]:
+                manifest.mark_completed(b_entry, size, run_id, "skipped", threads)
+            else:
+                pending_runs.append((b_entry, size, run_id, threads))
+        print_bold("\nResuming: {} of {} runs already have valid results, {} runs remaining.".format(
+            len(runs) - len(pending_runs), len(runs), len(pending_runs)
+        ))
+        runs = pending_runs
+
+    # Workers pull from a shared queue, so each worker processes its runs in the
+    # given (shuffled) order.
+    run_queue = Queue.Queue()
+    for i, (b_entry, size, run_id, threads) in enumerate(runs):
+        run_queue.put((i, b_entry, size, run_id, threads))
+
+    def worker(cpus):
+        while True:
+            try:
+                i, b_entry, size, run_id, threads = run_queue.get_nowait()
+            except Queue.Empty:
+                return
+            run_benchmark(i, len(runs), b_entry, size, run_id, threads, cpus, manifest, store, default_timeout, len(cpu_sets))
+
+    if len(cpu_sets) == 1:
+        worker(cpu_sets[0])
+    else:
+        threads = [
+            threading.Thread(target=worker, args=(cpus,))
+            for cpus in cpu_sets
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
 
-        # build
+def build_entries(args):
+    """ Process pool worker: Builds a group of entries one after another, see build_entry. """
+    b_entries, use_build_cache = args
+    return [build_entry(b_entry, use_build_cache) for b_entry in b_entries]
+
+
+def build_entry(b_entry, use_build_cache):
+    """ Builds an entry and captures its console output. """
+    stdout = sys.stdout
+    sys.stdout = build_log = StringIO()
+    try:
         t1 = time.time()
-        b_entry.build()
+        success = b_entry.build(use_build_cache)
         t2 = time.time()
-        print("[{:6.1f} sec]".format(t2 - t1))
+    finally:
+        sys.stdout = stdout
+    return success, build_log.getvalue(), t2 - t1
 
-    # run
-    runs = [
-        (b, size, run_id)
-        for b in benchmark_entries
-        for size in [Sizes.S, Sizes.M, Sizes.L]
-        for run_id in xrange(1, num_repetitions+1)
-    ]
-    # Maybe we want to shuffle only w.r.t language/run_id and keep sizes in order?
-    random.shuffle(runs)
 
-    for i, (b_entry, size, run_id) in enumerate(runs):
+def run_benchmark(i, num_runs, b_entry, size, run_id, threads=1, cpus=None, manifest=None, store=None, default_timeout=None, num_jobs=1):
 
-        print_bold("\nRunning benchmark [{} / {}]: {} / {} / {} / {} / {}".format(
-            i + 1, len(runs),
+    with console_lock:
+        print_bold("\nRunning benchmark [{} / {}]: {} / {} / {} / {} / {}{}{}".format(
+            i + 1, num_runs,
             b_entry.language, b_entry.benchmark_name, b_entry.impl_name,
             size, run_id,
+            "" if threads == 1 else " ({} threads)".format(threads),
+            "" if cpus is None else " (CPU {})".format(cpu_set_to_str(cpus)),
         ))
 
-        # run
-        b_meta_data = benchmark_meta[b_entry.benchmark_name]
-        args = b_meta_data.benchmark_args(size)
-        stdout_filename = os.path.join(b_entry.result_path, "stdout_run_{}_{:04d}".format(size, run_id))
-
-        t1 = time.time()
-        b_entry.run(args, stdout_filename)
-        t2 = time.time()
+    # run
+    b_meta_data = benchmark_meta[b_entry.benchmark_name]
+    args = get_benchmark_args(b_meta_data, size, b_entry.input_format, threads)
+    stdout_filename = b_entry.result_file(size, run_id, threads)
+    timeout = get_timeout(b_meta_data, b_entry.timeouts, size, default_timeout)
+
+    sampler = SystemSampler(cpus)
+    sampler.start()
+    t1 = time.time()
+    run_meta = b_entry.run(args, stdout_filename, cpus, timeout, threads)
+    t2 = time.time()
+    system_noise = sampler.stop()
+    with console_lock:
         print("[{:6.1f} sec]".format(t2 - t1))
+        if system_noise["throttled"]:
+            print_warn("CPU throttling observed during this run ({} throttle events, max. temperature: {} C).".format(
+                system_noise["throttle_events"], system_noise.get("temp_max_c", "n/a")
+            ))
+
+    # throttled runs are kept in the store, but excluded from the statistics
+    run_meta["throttled"] = system_noise.pop("throttled")
+    run_meta["system_noise"] = system_noise
+    # number of runs executed concurrently
+    run_meta["jobs"] = num_jobs
+
+    run_meta["impl_commit"] = b_entry.source_commit
+    run_meta["toolchain"] = get_toolchain_version(b_entry.language)
+
+    stage_names = b_meta_data.stages[1:]
+    stage_runtimes = None
+    if run_meta["status"] == "ok":
+        stage_runtimes = read_stage_runtimes(stdout_filename, len(stage_names))
+        if stage_runtimes is None:
+            run_meta["status"] = "failed"
+
+    if store is not None:
+        store.add_run(b_entry, size, run_id, run_meta, stage_runtimes, stage_names)
+    if manifest is not None:
+        manifest.mark_completed(b_entry, size, run_id, run_meta["status"], threads)
 
 
 # -----------------------------------------------------------------------------
 # Visualization
 # -----------------------------------------------------------------------------
 
+_template_env = None
+
+
+def get_template_env():
+    """
+    Shared template environment: Templates are compiled once per process, and the
+    compiled bytecode is cached on disk across processes.
+    """
+    global _template_env
+    if _template_env is None:
+        if not os.path.exists(Paths.template_cache):
+            os.makedirs(Paths.template_cache)
+        _template_env = Environment(
+            loader=FileSystemLoader(Paths.templates),
+            undefined=StrictUndefined,
+            bytecode_cache=FileSystemBytecodeCache(Paths.template_cache),
+        )
+    return _template_env
+
+
+def framework_source_files():
+    return sorted(glob.glob("bench_suite/*.py") + glob.glob("bench_suite/benchmarks/*.py"))
+
+
+def template_files(names):
+    return [os.path.join(Paths.templates, name) for name in names]
+
+
+def markdown_fragment_files():
+    return sorted(glob.glob(os.path.join(Paths.templates, "_*.md")))
+
+
+def compute_input_hash(files, runs, benchmark_entries, extra_data=()):
+    """
+    Hash of everything an output depends on: the given files (templates, framework code),
+    the benchmark.yml of each entry, and the runs of the entries.
+    """
+    files = list(files) + [
+        os.path.join(b_entry.impl_path, "benchmark.yml") for b_entry in benchmark_entries
+    ]
+    run_data = json.dumps(
+        [runs.get(entry_key(b_entry), []) for b_entry in benchmark_entries],
+        sort_keys=True,
+    )
+    return hash_files(files, [run_data] + list(extra_data))
+
+
+def visualize(force=False, include_throttled=False):
+    """
+    Renders all pages from the result store. Pages whose inputs did not change
+    since the last rendering are skipped, unless force is set. Runs during which
+    CPU throttling was observed are excluded, unless include_throttled is set.
+    """
+    store = ResultStore(Paths.result_store)
+    all_benchmark_entries = discover_stored_entries(store)
+    # Note for visualization we probably never want to filter
+    runs = store.load_runs()
+    store.close()
+
+    if not include_throttled:
+        num_runs = sum([len(entry_runs) for entry_runs in runs.itervalues()])
+        runs = exclude_throttled_runs(runs)
+        num_throttled = num_runs - sum([len(entry_runs) for entry_runs in runs.itervalues()])
+        if num_throttled > 0:
+            print_warn("Excluding {} runs with CPU throttling (use --include-throttled to keep them).".format(
+                num_throttled
+            ))
+
+    render_manifest = RenderManifest(Paths.render_manifest)
+
+    affected_benchmarks = sorted(set([b_entry.benchmark_name for b_entry in all_benchmark_entries]))
+    entries_per_benchmark = {
+        benchmark_name: [
+            b_entry for b_entry in all_benchmark_entries
+            if b_entry.benchmark_name == benchmark_name
+        ]
+        for benchmark_name in affected_benchmarks
+    }
+
+    # the navbar of every page lists all benchmark pages
+    sub_page_names = [
+        Paths.html_benchmark(benchmark_name) for benchmark_name in affected_benchmarks
+    ]
+    code_files = framework_source_files()
+
+    run_times_per_stage = dict()
+    for benchmark_name in affected_benchmarks:
+        entries_of_benchmark = entries_per_benchmark[benchmark_name]
+        out_path = os.path.join(Paths.html_benchmark(benchmark_name), "index.html")
+        input_hash = compute_input_hash(
+            code_files + template_files(["benchmark.html", "common_header.html", "navbar.html"]),
+            runs, entries_of_benchmark, sub_page_names,
+        )
+        run_times_per_stage.update(extract_run_times(runs, entries_of_benchmark))
+        if not force and render_manifest.is_up_to_date(out_path, input_hash):
+            print("Benchmark '{}' is up-to-date.".format(benchmark_name))
+            continue
+        meta_data = benchmark_meta[benchmark_name]
+        generate_benchmark_html(
+            benchmark_name, entries_of_benchmark, meta_data, run_times_per_stage,
+            extract_thread_sweep(runs, entries_of_benchmark),
+        )
+        render_manifest.update(out_path, input_hash)
+
+    out_path = os.path.join(Paths.html, "index.html")
+    input_hash = compute_input_hash(
+        code_files + template_files(["main.html", "common_header.html", "navbar.html"]) + markdown_fragment_files(),
+        runs, all_benchmark_entries, sub_page_names,
+    )
+    if force or not render_manifest.is_up_to_date(out_path, input_hash):
+        generate_summary_html(affected_benchmarks, all_benchmark_entries, run_times_per_stage)
+        render_manifest.update(out_path, input_hash)
+    else:
+        print("Main page is up-to-date.")
+
+    out_path = "README.md"
+    input_hash = hash_files(code_files + template_files(["README.md"]) + markdown_fragment_files())
+    if force or not render_manifest.is_up_to_date(out_path, input_hash):
+        generate_summary_markdown()
+        render_manifest.update(out_path, input_hash)
+
+    render_manifest.save()
+
+
 def locate_sub_pages(relative_path="."):
     sub_pages_folder = sorted(glob.glob(
         Paths.html + "/*/index.html"
@@ -329,52 +930,123 @@ def locate_sub_pages(relative_path="."):
     return sub_pages
 
 
-def get_median_runtime_of_largest_size(run_times):
-    filtered_run_times = []
-    num_repetitions = len(run_times) // len(Sizes)
-    for i, value in enumerate(run_times):
-        size = {
-            0: Sizes.S,
-            1: Sizes.M,
-            2: Sizes.L,
-        }[i // num_repetitions]
-        # filter on largest results
-        if size == Sizes.L:
-            filtered_run_times.append(value)
+def discover_stored_entries(store):
+    """ Returns the benchmark entries which have results in the store. """
+    entries = [
+        BenchmarkEntry(language, benchmark_id, benchmark_name, impl_id, impl_name)
+        for language, benchmark_id, benchmark_name, impl_id, impl_name in store.list_entries()
+    ]
+    entries.sort(key=lambda x:
+        (x.language, x.benchmark_id, x.impl_id, x.impl_path)
+    )
+    return entries
 
-    return np.median(filtered_run_times)
+
+def extract_run_times(runs, benchmark_entries, threads=1):
+    """
+    Applies the result extractors to the runs loaded from the store, i.e.,
+    returns a "dict[benchmark_entry][stage][size] => list of runtimes".
+    Only runs with the given number of threads are considered.
+    """
+    return {
+        b_entry: benchmark_meta[b_entry.benchmark_name].result_extractor([
+            run for run in runs.get(entry_key(b_entry), []) if run.get("threads", 1) == threads
+        ])
+        for b_entry in benchmark_entries
+    }
+
+
+def extract_thread_sweep(runs, benchmark_entries):
+    """
+    Returns a "dict[benchmark_entry][threads][stage][size] => list of runtimes" for
+    the entries which have runs with more than one thread, including the single-threaded runs.
+    """
+    run_times_per_thread_count = dict()
+    for b_entry in benchmark_entries:
+        thread_counts = sorted(set([run.get("threads", 1) for run in runs.get(entry_key(b_entry), [])]))
+        if len(thread_counts) > 1:
+            run_times_per_thread_count[b_entry] = {
+                threads: extract_run_times(runs, [b_entry], threads)[b_entry]
+                for threads in thread_counts
+            }
+    return run_times_per_thread_count
+
+
+def get_plot_stages(meta_data):
+    """ Stages which get a raw run time plot, followed by the resource metrics. """
+    return meta_data.stages + [overhead_stage] + resource_metrics
+
+
+def get_summary_of_largest_size(run_times, meta_data):
+    return summarize(run_times[get_largest_size(meta_data)])
+
+
+def format_throughput(throughput_metric, runtime, size):
+    """ Throughput value for the CSVs, empty if the stage has no throughput metric. """
+    if throughput_metric is None:
+        return ""
+    throughput = throughput_metric.from_runtime(runtime, size)
+    return throughput if throughput is not None else ""
+
+
+def size_hue(size_index, num_sizes):
+    """ Hue of a size in the plots, ranging from green (smallest) over blue to red (largest). """
+    if num_sizes <= 1:
+        return 0
+    return int(round(136 + (360 - 136) * size_index / (num_sizes - 1))) % 360
 
 
 def write_raw_runtime_csv(benchmark_name, run_times_per_stage, benchmark_entries, meta_data):
 
-    for stage_id, stage in enumerate(meta_data.stages, 1):
+    for stage_id, stage in enumerate(get_plot_stages(meta_data), 1):
+
+        throughput_metric = get_throughput_metric(meta_data, stage)
 
         rows = []
         for b_entry in benchmark_entries:
             run_times = run_times_per_stage[b_entry][stage]
-            num_repetitions = len(run_times) // len(Sizes)
-            for i, value in enumerate(run_times):
-                size = {
-                    0: Sizes.S,
-                    1: Sizes.M,
-                    2: Sizes.L,
-                }[i // num_repetitions]
-                run_id = (i % num_repetitions) + 1
-                row = {
-                    "lang": b_entry.language,
-                    "descr": b_entry.impl_suffix,
-                    "label": b_entry.language + " (" + b_entry.impl_suffix + ")",
-                    "size": size,
-                    "run_id": run_id,
-                    "time": value
-                }
-                rows.append(row)
+            timeouts = run_times_per_stage[b_entry][timeout_stage]
+            size_ladder = get_size_ladder(meta_data)
+            for size_index, size in enumerate(size_ladder):
+                hue = size_hue(size_index, len(size_ladder))
+                label = b_entry.language + " (" + b_entry.impl_suffix + ")"
+                outliers = outlier_mask(run_times[size])
+                for run_id, (value, is_outlier) in enumerate(zip(run_times[size], outliers), 1):
+                    row = {
+                        "lang": b_entry.language,
+                        "descr": b_entry.impl_suffix,
+                        "label": label,
+                        "size": size,
+                        "run_id": run_id,
+                        "time": value,
+                        "status": "ok",
+                        "outlier": int(is_outlier),
+                        "hue": hue,
+                        "throughput": format_throughput(throughput_metric, value, size),
+                    }
+                    rows.append(row)
+                # timed out runs have no values, they are shown as markers
+                if stage not in resource_metrics:
+                    for timeout in timeouts[size]:
+                        row = {
+                            "lang": b_entry.language,
+                            "descr": b_entry.impl_suffix,
+                            "label": label,
+                            "size": size,
+                            "run_id": "",
+                            "time": timeout,
+                            "status": "timeout",
+                            "outlier": 0,
+                            "hue": hue,
+                            "throughput": "",
+                        }
+                        rows.append(row)
 
         plot_csv = Paths.html_raw_runtime_csv(benchmark_name, stage_id, stage)
 
         write_csv_with_schema(
             plot_csv, rows,
-            schema=["lang", "descr", "label", "size", "run_id", "time"]
+            schema=["lang", "descr", "label", "size", "run_id", "time", "status", "outlier", "hue", "throughput"]
         )
 
 
@@ -384,21 +1056,31 @@ def write_stage_summary_csv(benchmark_name, run_times_per_stage, benchmark_entri
 
     for b_entry in benchmark_entries:
 
-        for stage_id, stage in enumerate(meta_data.stages, 1):
+        for stage_id, stage in enumerate(meta_data.stages + [overhead_stage], 1):
 
             # ugly hack: don't add the total stage to these plots
             if stage == "Total":
                 continue
 
-            run_times = run_times_per_stage[b_entry][stage]
-            median_of_largest_size = get_median_runtime_of_largest_size(run_times)
+            summary = get_summary_of_largest_size(run_times_per_stage[b_entry][stage], meta_data)
+            if summary is None:
+                continue
+            throughput_metric = get_throughput_metric(meta_data, stage)
 
             row = {
                 "lang": b_entry.language,
                 "descr": b_entry.impl_suffix,
                 "label": b_entry.language + " (" + b_entry.impl_suffix + ")",
                 "stage": stage,
-                "time": median_of_largest_size
+                "time": summary["median"],
+                "ci_low": summary["ci_low"],
+                "ci_high": summary["ci_high"],
+                "iqr": summary["iqr"],
+                "mad": summary["mad"],
+                "num_runs": summary["n"],
+                "num_outliers": summary["num_outliers"],
+                "throughput": format_throughput(throughput_metric, summary["median"], get_largest_size(meta_data)),
+                "throughput_unit": throughput_metric.unit if throughput_metric is not None else "",
             }
             rows.append(row)
 
@@ -406,46 +1088,175 @@ def write_stage_summary_csv(benchmark_name, run_times_per_stage, benchmark_entri
 
     write_csv_with_schema(
         plot_csv, rows,
-        schema=["lang", "descr", "label", "stage", "time"]
+        schema=[
+            "lang", "descr", "label", "stage", "time", "ci_low", "ci_high", "iqr", "mad", "num_runs", "num_outliers",
+            "throughput", "throughput_unit",
+        ]
     )
 
 
-def generate_benchmark_html(name, benchmark_entries, meta_data):
+def write_scaling_csv(benchmark_name, run_times_per_stage, benchmark_entries, meta_data):
+    """
+    Fits the empirical complexity "time = constant * size^exponent" of each entry and
+    stage to the median run times of all sizes of the ladder. Writes the medians along
+    with the fit parameters, and returns a dict "(b_entry, stage) => (exponent, constant, r^2)".
+    """
+    rows = []
+    fits = dict()
+
+    for b_entry in benchmark_entries:
+        for stage in meta_data.stages:
+            run_times = run_times_per_stage[b_entry][stage]
+            points = [
+                (size, meta_data.size_magnitude(size, stage), np.median(run_times[size]))
+                for size in get_size_ladder(meta_data)
+                if len(run_times[size]) > 0
+            ]
+            fit = fit_power_law([p[1] for p in points], [p[2] for p in points])
+            if fit is None:
+                continue
+            fits[(b_entry, stage)] = fit
+
+            for size, magnitude, median in points:
+                rows.append({
+                    "lang": b_entry.language,
+                    "descr": b_entry.impl_suffix,
+                    "label": b_entry.language + " (" + b_entry.impl_suffix + ")",
+                    "stage": stage,
+                    "size": size,
+                    "magnitude": magnitude,
+                    "time": median,
+                    "exponent": fit[0],
+                    "constant": fit[1],
+                })
+
+    write_csv_with_schema(
+        Paths.html_scaling_csv(benchmark_name), rows,
+        schema=["lang", "descr", "label", "stage", "size", "magnitude", "time", "exponent", "constant"]
+    )
+    return fits
+
+
+def write_thread_scaling_csv(benchmark_name, run_times_per_thread_count, meta_data):
+    """
+    Writes the median run time of the thread scaling stage of the benchmark (by default
+    "Total") for every thread sweep size and thread count, along with the speedup relative
+    to the single-threaded runs and the parallel efficiency (speedup / threads). For weak
+    scaling sizes, the speedup is the scaled speedup, i.e., threads * T(1) / T(threads).
+    Returns the stage.
+    """
+    stage = getattr(meta_data, "thread_scaling_stage", "Total")
+    rows = []
+
+    for b_entry, run_times_per_threads in sorted(run_times_per_thread_count.iteritems(), key=lambda x: x[0].impl_path):
+        label = b_entry.language + " (" + b_entry.impl_suffix + ")"
+        for size in get_thread_sweep_sizes(meta_data):
+            mode = "weak" if is_weak_scaling_size(meta_data, size) else "strong"
+            baseline = run_times_per_threads.get(1, {}).get(stage, {}).get(size, [])
+            if len(baseline) == 0:
+                continue
+            baseline_median = np.median(baseline)
+            for threads, run_times in sorted(run_times_per_threads.iteritems()):
+                if len(run_times[stage].get(size, [])) == 0:
+                    continue
+                median = np.median(run_times[stage][size])
+                speedup = baseline_median / median
+                if mode == "weak":
+                    speedup *= threads
+                rows.append({
+                    "lang": b_entry.language,
+                    "descr": b_entry.impl_suffix,
+                    "label": label,
+                    "series": "{}, {} {} scaling".format(label, size, mode),
+                    "size": size,
+                    "mode": mode,
+                    "threads": threads,
+                    "time": median,
+                    "speedup": speedup,
+                    "efficiency": speedup / threads,
+                })
+
+    write_csv_with_schema(
+        Paths.html_thread_scaling_csv(benchmark_name), rows,
+        schema=["lang", "descr", "label", "series", "size", "mode", "threads", "time", "speedup", "efficiency"]
+    )
+    return stage
+
+
+def generate_benchmark_html(name, benchmark_entries, meta_data, run_times_per_stage, run_times_per_thread_count=None):
+    """
+    Renders the page of a benchmark. run_times_per_stage is a
+    "dict[benchmark_entry][stage][size] => list of runtimes" (see extract_run_times),
+    run_times_per_thread_count holds the runs of thread sweeps (see extract_thread_sweep).
+    """
     num_entries = len(benchmark_entries)
     print_bold("\nRendering html of benchmark '{}' with {} entries".format(
         name, num_entries
     ))
 
-    # The extractors return a dict of "stage => list of runtimes", i.e,
-    # run_times_per_stage becomes a "dict[benchmark_entry][stage] => list of runtimes"
-    run_times_per_stage = {
-        b_entry: meta_data.result_extractor(b_entry) for b_entry in benchmark_entries
-    }
-
     # extract and write CSVs
     write_raw_runtime_csv(name, run_times_per_stage, benchmark_entries, meta_data)
     write_stage_summary_csv(name, run_times_per_stage, benchmark_entries, meta_data)
+    fits = write_scaling_csv(name, run_times_per_stage, benchmark_entries, meta_data)
+
+    # speedup and parallel efficiency of thread sweeps
+    thread_scaling_calls = []
+    thread_scaling_stage = None
+    thread_scaling_sizes = []
+    if run_times_per_thread_count:
+        thread_scaling_stage = write_thread_scaling_csv(name, run_times_per_thread_count, meta_data)
+        thread_scaling_sizes = [
+            (size, "weak" if is_weak_scaling_size(meta_data, size) else "strong", meta_data.size_description(size))
+            for size in get_thread_sweep_sizes(meta_data)
+        ]
+        thread_scaling_csv_basename = os.path.basename(Paths.html_thread_scaling_csv(name))
+        thread_scaling_calls = [
+            'visualizeThreadScalingCsv("{}", "#thread-speedup", "speedup");'.format(thread_scaling_csv_basename),
+            'visualizeThreadScalingCsv("{}", "#thread-efficiency", "efficiency");'.format(thread_scaling_csv_basename),
+        ]
 
     # prepare template code
     plot_calls = []
     plot_htmls = []
     stage_id = 0
-    for stage in meta_data.stages:
+    for stage in get_plot_stages(meta_data):
         stage_id += 1
 
-        linear_scale = meta_data.linear_scales[stage]
+        linear_scale = meta_data.linear_scales.get(stage, False)
+
+        if stage in resource_metrics:
+            quantity = stage
+            unit = resource_metric_units[stage]
+            title = "{} [{}]".format(stage, unit)
+        else:
+            quantity = "Runtime"
+            unit = "sec"
+            title = "Run time: {}".format(stage)
+
+        # stages with a throughput metric get a toggle between run time and throughput
+        throughput_metric = get_throughput_metric(meta_data, stage)
+        if throughput_metric is not None:
+            throughput_options = {
+                "unit": throughput_metric.unit,
+                "higherIsBetter": throughput_metric.higher_is_better,
+            }
+        else:
+            throughput_options = None
 
         plot_csv_basename = os.path.basename(Paths.html_raw_runtime_csv(name, stage_id, stage))
         plot_calls += [
-            'visualizeCsv("{}", "#plot{}", {});'.format(
+            'visualizeCsv("{}", "#plot{}", {}, "{}", "{}", {});'.format(
                 plot_csv_basename,
                 stage_id,
-                "true" if linear_scale else "false"
+                "true" if linear_scale else "false",
+                quantity,
+                unit,
+                json.dumps(throughput_options),
             )
         ]
         div = '<div id="plot{}"></div>'.format(stage_id)
         plot_htmls += [
-            (stage, div)
+            (title, div)
         ]
 
     # get implementation paths
@@ -455,13 +1266,59 @@ def generate_benchmark_html(name, benchmark_entries, meta_data):
             (b_entry.language, b_entry.source_url, b_entry.source_description)
         ]
 
+    # size ladder, colored like the markers of the raw plots
+    size_ladder = get_size_ladder(meta_data)
+    sizes = [
+        (size, meta_data.size_description(size), size_hue(size_index, len(size_ladder)))
+        for size_index, size in enumerate(size_ladder)
+    ]
+
+    # scaling plots and fitted exponents
+    scaling_csv_basename = os.path.basename(Paths.html_scaling_csv(name))
+    scaling_plot_calls = []
+    scaling_plot_htmls = []
+    for stage_id, stage in enumerate(meta_data.stages, 1):
+        scaling_plot_calls += [
+            'visualizeScalingCsv("{}", "#scaling{}", "{}", "{}");'.format(
+                scaling_csv_basename, stage_id, stage, meta_data.size_quantity,
+            )
+        ]
+        scaling_plot_htmls += [
+            ("Scaling: {}".format(stage), '<div id="scaling{}"></div>'.format(stage_id))
+        ]
+
+    scaling_fits = []
+    for b_entry in benchmark_entries:
+        exponents = []
+        for stage in meta_data.stages:
+            fit = fits.get((b_entry, stage))
+            exponents.append(
+                ("{:.2f}".format(fit[0]), "{:.3f}".format(fit[2])) if fit is not None else None
+            )
+        scaling_fits += [(
+            b_entry.language + " (" + b_entry.impl_suffix + ")",
+            exponents,
+        )]
+
+    # number of valid runs per size (may differ when using adaptive repetitions)
+    run_counts = []
+    for b_entry in benchmark_entries:
+        counts = []
+        for size in get_size_ladder(meta_data):
+            count = str(len(run_times_per_stage[b_entry]["Total"][size]))
+            num_timeouts = len(run_times_per_stage[b_entry][timeout_stage][size])
+            if num_timeouts > 0:
+                count += " (+{} timeouts)".format(num_timeouts)
+            counts.append(count)
+        run_counts += [(
+            b_entry.language + " (" + b_entry.impl_suffix + ")",
+            counts,
+        )]
+
     # compile html
     html_description = markdown.markdown(meta_data.description)
 
-    env = Environment(
-        loader=FileSystemLoader(Paths.templates),
-        undefined=StrictUndefined,
-    )
+    env = get_template_env()
     benchmark_template = env.get_template('benchmark.html')
 
     # Navbar requires knowledge of all pages as well.
@@ -480,10 +1337,16 @@ def generate_benchmark_html(name, benchmark_entries, meta_data):
         navbar=navbar,
         title=meta_data.title,
         description=html_description,
-        description_s=meta_data.size_description(Sizes.S),
-        description_m=meta_data.size_description(Sizes.M),
-        description_l=meta_data.size_description(Sizes.L),
+        sizes=sizes,
+        scaling_plot_calls=scaling_plot_calls,
+        scaling_plot_htmls=scaling_plot_htmls,
+        scaling_fits=scaling_fits,
+        thread_scaling_calls=thread_scaling_calls,
+        thread_scaling_stage=thread_scaling_stage,
+        thread_scaling_sizes=thread_scaling_sizes,
+        stages=meta_data.stages,
         impl_locs=impl_locs,
+        run_counts=run_counts,
         plot_calls=plot_calls,
         plot_htmls=plot_htmls,
     )
@@ -493,76 +1356,108 @@ def generate_benchmark_html(name, benchmark_entries, meta_data):
         f.write(html)
 
 
-def write_general_summary_csv(affected_benchmarks, all_benchmark_entries):
+def write_general_summary_csv(affected_benchmarks, all_benchmark_entries, run_times_per_stage):
 
-    runtimes = dict()
+    summaries = dict()
     relative_runtimes = dict()
     ranks = dict()
+    rank_ranges_all = dict()
+    peak_rss = dict()
+    cpu_times = dict()
+    throughput_metrics = dict()
+    largest_sizes = dict()
 
     for benchmark_name in affected_benchmarks:
         benchmark_entries = [
             b_entry for b_entry in all_benchmark_entries
             if b_entry.benchmark_name == benchmark_name
             ]
-        meta_data = benchmark_meta[benchmark_name]
 
-        def get_max_runtime(b_entry):
-            per_stage_result = meta_data.result_extractor(b_entry)
-            return get_median_runtime_of_largest_size(per_stage_result["Total"])
+        meta_data = benchmark_meta[benchmark_name]
+        largest_size = get_largest_size(meta_data)
 
-        runtimes_this_benchmark = dict()
+        summaries_this_benchmark = dict()
         for b_entry in benchmark_entries:
-            runtimes_this_benchmark[b_entry] = get_max_runtime(b_entry)
+            per_stage_result = run_times_per_stage[b_entry]
+            summary = get_summary_of_largest_size(per_stage_result["Total"], meta_data)
+            # entries without any valid run of the largest size (e.g. timeouts) are not ranked
+            if summary is None:
+                continue
+            summaries_this_benchmark[b_entry] = summary
+            # runs imported from old results may lack the resource metrics
+            peak_rss[b_entry] = np.median(per_stage_result["Peak RSS"][largest_size] or [np.nan])
+            cpu_times[b_entry] = np.median(per_stage_result["CPU time"][largest_size] or [np.nan])
+            throughput_metrics[b_entry] = get_throughput_metric(meta_data, "Total")
+            largest_sizes[b_entry] = largest_size
 
-        fastest = min(runtimes_this_benchmark.values())
+        if len(summaries_this_benchmark) == 0:
+            continue
+        fastest = min([summary["median"] for summary in summaries_this_benchmark.values()])
 
         # for the time being a quadratic implementation suffices, improve if necessary
-        for b_entry in benchmark_entries:
-            runtime = runtimes_this_benchmark[b_entry]
+        for b_entry, summary in summaries_this_benchmark.iteritems():
             faster_entries = [
-                other_entry for other_entry, other_time in runtimes_this_benchmark.iteritems()
-                if other_time < runtime
+                other_entry for other_entry, other_summary in summaries_this_benchmark.iteritems()
+                if other_summary["median"] < summary["median"]
             ]
 
             # update global dicts
-            runtimes[b_entry] = runtime
+            summaries[b_entry] = summary
             ranks[b_entry] = len(faster_entries) + 1
-            relative_runtimes[b_entry] = runtime / fastest
+            relative_runtimes[b_entry] = summary["median"] / fastest
+
+        rank_ranges_all.update(rank_ranges(summaries_this_benchmark))
 
     rows = []
     for b_entry in all_benchmark_entries:
+        if b_entry not in summaries:
+            continue
+        summary = summaries[b_entry]
         rows += [{
             "benchmark": b_entry.benchmark_name,
             "lang": b_entry.language,
             "descr": b_entry.impl_suffix,
             "url": b_entry.source_url,
             "label": b_entry.language + " (" + b_entry.impl_suffix + ")",
-            "time": runtimes[b_entry],
+            "time": summary["median"],
+            "time_ci_low": summary["ci_low"],
+            "time_ci_high": summary["ci_high"],
+            "time_iqr": summary["iqr"],
+            "time_mad": summary["mad"],
+            "num_runs": summary["n"],
+            "num_outliers": summary["num_outliers"],
             "relative": relative_runtimes[b_entry],
             "rank": ranks[b_entry],
+            "rank_best": rank_ranges_all[b_entry][0],
+            "rank_worst": rank_ranges_all[b_entry][1],
+            "peak_rss": peak_rss[b_entry],
+            "cpu_time": cpu_times[b_entry],
+            "throughput": format_throughput(throughput_metrics[b_entry], summary["median"], largest_sizes[b_entry]),
+            "throughput_unit": throughput_metrics[b_entry].unit if throughput_metrics[b_entry] is not None else "",
         }]
 
     csv_filename = os.path.join(Paths.html, "summary.csv")
     write_csv_with_schema(
         csv_filename, rows,
-        schema=["benchmark", "lang", "descr", "url", "label", "time", "relative", "rank"]
+        schema=[
+            "benchmark", "lang", "descr", "url", "label",
+            "time", "time_ci_low", "time_ci_high", "time_iqr", "time_mad", "num_runs", "num_outliers",
+            "relative", "rank", "rank_best", "rank_worst", "peak_rss", "cpu_time", "throughput", "throughput_unit",
+        ]
     )
 
 
-def generate_summary_html(affected_benchmarks, all_benchmark_entries):
+def generate_summary_html(affected_benchmarks, all_benchmark_entries, run_times_per_stage):
     print_bold("\nRendering main html")
 
-    write_general_summary_csv(affected_benchmarks, all_benchmark_entries)
+    write_general_summary_csv(affected_benchmarks, all_benchmark_entries, run_times_per_stage)
 
     sub_pages = locate_sub_pages(".")
 
     # load markdown elements and convert to html
     markdown_fragments = load_markdown_fragments(convert_to_html=True)
 
-    env = Environment(
-        loader=FileSystemLoader(Paths.templates),
-        undefined=StrictUndefined,
-    )
+    env = get_template_env()
     benchmark_template = env.get_template('main.html')
 
     common_header = env.get_template('common_header.html').render(
@@ -588,6 +1483,36 @@ def generate_summary_html(affected_benchmarks, all_benchmark_entries):
         f.write(html)
 
 
+def list_sessions():
+    store = ResultStore(Paths.result_store)
+    sessions = store.list_sessions()
+    store.close()
+    print_bold("\nBenchmark sessions:")
+    for session_id, started, git_commit, software_specs, num_runs in sessions:
+        print("{:4d}  {}  commit {}  {:5d} runs".format(session_id, started, git_commit, num_runs))
+        for label, version in software_specs:
+            print("        {}: {}".format(label, version))
+
+
+def compare_with_baseline(session_id=None, baseline_id=None, alpha=0.05, min_slowdown=0.05, include_throttled=False):
+    """ Compares a session against a baseline, returns whether there are regressions. """
+    store = ResultStore(Paths.result_store)
+    comparisons = compare_sessions(store, session_id, baseline_id, alpha, min_slowdown, include_throttled)
+    store.close()
+    return any(comparison.is_regression for comparison in comparisons)
+
+
+def import_results(benchmark_entries):
+    """ Imports the results of the directory layout ("results/<lang>/...") into the result store. """
+    store = ResultStore(Paths.result_store)
+    num_imported = import_result_files(
+        store, benchmark_entries,
+        lambda b_entry: benchmark_meta[b_entry.benchmark_name]
+    )
+    store.close()
+    print_bold("\nImported {} runs into [{}]".format(num_imported, Paths.result_store))
+
+
 def load_markdown_fragments(convert_to_html=False):
     fragments = [
         "contribute",
@@ -612,10 +1537,7 @@ def load_markdown_fragments(convert_to_html=False):
 
 def generate_summary_markdown():
 
-    env = Environment(
-        loader=FileSystemLoader(Paths.templates),
-        undefined=StrictUndefined,
-    )
+    env = get_template_env()
     readme_template = env.get_template("README.md")
 
     markdown_fragments = load_markdown_fragments()
@@ -2,45 +2,333 @@
 
 from __future__ import print_function
 
-import random
-import string
+import os
+import zlib
+import json
+import hashlib
+import multiprocessing
+
 import numpy as np
 
+from .utils import print_warn, ensure_dir_exists, read_yaml, write_yaml
+
+
+dataset_manifest_path = os.path.abspath("data/generated/datasets.yml")
+
+default_seed = 42
+
+# must be incremented whenever a generator produces different output for the same parameters
+generator_version = 1
+
 
-def random_word(length):
-    return ''.join(random.choice(string.lowercase) for _ in xrange(length))
+def random_word_pool(num_words, random_state):
+    """
+    Generates random lowercase words with lengths between 1 and 20. The words are
+    returned as one character buffer, in which each word is preceded by a space,
+    along with the offsets of these space-prefixed words and the word lengths.
+    """
+    lengths = random_state.randint(1, 21, size=num_words)
+    offsets = np.concatenate([[0], np.cumsum(lengths + 1)[:-1]])
+    buffer = random_state.randint(ord('a'), ord('z') + 1, size=(lengths + 1).sum()).astype(np.uint8)
+    buffer[offsets] = ord(' ')
+    return buffer, offsets, lengths
 
 
-def generate_text(path, chars_to_write=100*1000*1000):
+def find_line_starts(word_lengths, max_line_length=80):
+    """
+    Determines the indices of the words which start a new line, when lines are
+    filled greedily as long as the line (including the new word) stays shorter
+    than max_line_length.
+    """
+    # offsets[i] = position of word i when words are joined by a single separator
+    offsets = np.concatenate([[0], np.cumsum(word_lengths + 1)])
+    # next_line_start[i] = first word which does not fit into a line starting at word i
+    next_line_start = (np.searchsorted(offsets, offsets[:-1] + max_line_length + 1, side="right") - 1).tolist()
+
+    # following the chain is the only sequential part, it takes one step per line
+    line_starts = []
+    i = 0
+    num_words = len(word_lengths)
+    while i < num_words:
+        line_starts.append(i)
+        i = next_line_start[i]
+    return line_starts
+
+
+def generate_text(path, chars_to_write=100*1000*1000, seed=default_seed, chunk_words=250*1000):
+
+    random_state = np.random.RandomState(seed)
 
     num_words = 100000
 
-    random_words = [random_word(random.randint(1, 20)) for _ in xrange(num_words)]
+    pool_buffer, pool_offsets, pool_lengths = random_word_pool(num_words, random_state)
 
-    with open(path, "w") as f:
+    with open(path, "wb") as f:
         chars_written = 0
-        chars_in_line = 0
 
         while chars_written < chars_to_write:
-            w = random.choice(random_words)
+            indices = random_state.randint(0, num_words, size=chunk_words)
+            lengths = pool_lengths[indices]
+
+            # stop after the word which reaches the requested size
+            chars_cumulative = np.cumsum(lengths + 1)
+            if chars_written + chars_cumulative[-1] > chars_to_write:
+                num_chunk_words = np.searchsorted(chars_cumulative, chars_to_write - chars_written) + 1
+                indices = indices[:num_chunk_words]
+                lengths = lengths[:num_chunk_words]
+
+            # gather the space-prefixed words from the pool into one buffer
+            segment_lengths = lengths + 1
+            out_offsets = np.concatenate([[0], np.cumsum(segment_lengths)[:-1]])
+            gather_indices = (
+                np.arange(segment_lengths.sum()) +
+                np.repeat(pool_offsets[indices] - out_offsets, segment_lengths)
+            )
+            chunk = pool_buffer[gather_indices]
+
+            # every chunk starts a new line, so line breaking can be done per chunk
+            chunk[out_offsets[find_line_starts(lengths)]] = ord('\n')
+            if chars_written == 0:
+                chunk = chunk[1:]
+
+            f.write(chunk.tostring())
+            chars_written += len(chunk)
+
+
+def generate_matrix(path, N, seed=default_seed, chunk_rows=100):
+    random_state = np.random.RandomState(seed)
+    with open(path, "w") as f:
+        # same format as np.savetxt(path, X, delimiter=";"), but without
+        # holding the matrix in memory or formatting values in Python
+        for first_row in xrange(0, N, chunk_rows):
+            num_rows = min(chunk_rows, N - first_row)
+            X = random_state.uniform(-1, 1, size=(num_rows, N))
+            for row in X:
+                row.tofile(f, sep=";", format="%.18e")
+                f.write("\n")
+
+
+def generate_matrix_npy(path, N, seed=default_seed, chunk_rows=100):
+    """
+    Writes the same matrix as generate_matrix (for the same seed) in .npy format,
+    i.e., raw little-endian float64 values in C order behind a small header.
+    """
+    random_state = np.random.RandomState(seed)
+    X = np.lib.format.open_memmap(path, mode="w+", dtype="<f8", shape=(N, N))
+    for first_row in xrange(0, N, chunk_rows):
+        num_rows = min(chunk_rows, N - first_row)
+        X[first_row:first_row + num_rows] = random_state.uniform(-1, 1, size=(num_rows, N))
+    X.flush()
+    del X
+
+
+def generate_int64_array(path, num_values, order="random", seed=default_seed):
+    """
+    Writes non-negative random integers as raw little-endian int64 values, in random,
+    "sorted", or "reversed" order. All orders contain the same values (for the same seed).
+    """
+    random_state = np.random.RandomState(seed)
+    values = random_state.randint(0, 2**62, size=num_values, dtype=np.int64)
+    if order != "random":
+        values = np.sort(values)
+    if order == "reversed":
+        values = values[::-1]
+    values.astype("<i8").tofile(path)
+
+
+def generate_strings(path, num_strings, order="random", seed=default_seed):
+    """ Writes random lowercase strings with lengths between 1 and 20, each terminated by a newline. """
+    random_state = np.random.RandomState(seed)
+    buffer, _, _ = random_word_pool(num_strings, random_state)
+    strings = buffer.tostring().split()
+    if order != "random":
+        strings.sort(reverse=(order == "reversed"))
+    with open(path, "wb") as f:
+        f.write("\n".join(strings))
+        f.write("\n")
+
+
+class _RandomStream(object):
+    """ Draws random numbers from a RandomState in blocks, which is much faster than single draws. """
+
+    def __init__(self, random_state, block_size=4096):
+        self.random_state = random_state
+        self.block_size = block_size
+        self.values = []
+        self.index = 0
+
+    def random(self):
+        if self.index == len(self.values):
+            self.values = self.random_state.uniform(size=self.block_size).tolist()
+            self.index = 0
+        self.index += 1
+        return self.values[self.index - 1]
+
+    def randint(self, low, high):
+        """ Random integer in [low, high). """
+        return low + int(self.random() * (high - low))
+
+    def choice(self, items):
+        return items[int(self.random() * len(items))]
+
+
+def random_json_record(rng, words, depth, fanout):
+    """
+    Generates a nested record: scalar fields of all JSON types, a list of strings,
+    an object with a random set of keys, and up to fanout children records (of depth - 1).
+    """
+    attributes = dict()
+    for _ in xrange(rng.randint(1, 8)):
+        attributes[rng.choice(words)] = round(rng.random() * 1000, 3)
+    record = {
+        "id": rng.randint(0, 1000000),
+        "name": rng.choice(words),
+        "score": round(rng.random() * 100, 3),
+        "active": rng.random() < 0.5,
+        "parent": None,
+        "tags": [rng.choice(words) for _ in xrange(rng.randint(0, 6))],
+        "attributes": attributes,
+    }
+    if depth > 1:
+        record["children"] = [
+            random_json_record(rng, words, depth - 1, fanout)
+            for _ in xrange(rng.randint(0, fanout + 1))
+        ]
+    return record
+
+
+def generate_json(path, num_records=10000, max_depth=3, fanout=3, seed=default_seed):
+    """
+    Writes a JSON document consisting of a list of num_records nested records
+    (see random_json_record), with one record per line.
+    """
+    random_state = np.random.RandomState(seed)
+    rng = _RandomStream(random_state)
+
+    pool_buffer, pool_offsets, pool_lengths = random_word_pool(1000, random_state)
+    words = [
+        pool_buffer[offset + 1:offset + 1 + length].tostring()
+        for offset, length in zip(pool_offsets, pool_lengths)
+    ]
+
+    with open(path, "w") as f:
+        f.write("[\n")
+        for i in xrange(num_records):
+            if i > 0:
+                f.write(",\n")
+            f.write(json.dumps(random_json_record(rng, words, max_depth, fanout), sort_keys=True))
+        f.write("\n]\n")
+
+
+def dataset_seed(path):
+    """ Deterministic seed of a dataset, so that different files do not share their random sequence. """
+    return (zlib.crc32(os.path.basename(path)) ^ default_seed) & 0x7fffffff
+
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _dataset_entry(func, params, seed):
+    return {
+        "generator": func.__name__,
+        "generator_version": generator_version,
+        "params": params,
+        "seed": seed,
+    }
+
+
+def _is_valid_dataset(path, entry, manifest_entry):
+    """
+    Checks a dataset against its manifest entry. The (potentially huge) file is
+    only hashed if its modification time differs from the recorded one.
+    """
+    if manifest_entry is None or not os.path.exists(path):
+        return False
+    if any(manifest_entry.get(key) != value for key, value in entry.iteritems()):
+        return False
+    if os.path.getsize(path) != manifest_entry.get("bytes"):
+        return False
+    if os.path.getmtime(path) == manifest_entry.get("mtime"):
+        return True
+    return file_sha1(path) == manifest_entry.get("sha1")
+
+
+def _run_generator(job):
+    func, path, kwargs = job
+    func(path, **kwargs)
+    return os.path.getsize(path), os.path.getmtime(path), file_sha1(path)
+
 
-            if chars_in_line == 0:
-                f.write(w)
-                chars_in_line += len(w)
-                chars_written += len(w)
+def run_generators(jobs):
+    """
+    Runs independent generator jobs, given as (function, path, kwargs) tuples,
+    in a process pool. Returns (file size, modification time, SHA1) of every generated file.
+    """
+    if len(jobs) == 0:
+        return []
+    if len(jobs) == 1:
+        return [_run_generator(jobs[0])]
+    pool = multiprocessing.Pool(min(len(jobs), multiprocessing.cpu_count()))
+    try:
+        return pool.map(_run_generator, jobs)
+    finally:
+        pool.close()
+        pool.join()
 
-            elif chars_in_line + len(w) < 80:
-                f.write(" " + w)
-                chars_in_line += len(w) + 1
-                chars_written += len(w) + 1
 
-            else:
-                f.write("\n" + w)
-                chars_in_line = len(w)
-                chars_written += len(w)
+def ensure_datasets(datasets):
+    """
+    Makes sure that all datasets, given as (path, generator function, params) tuples,
+    exist and match their entry in the dataset manifest. The seed is derived from the
+    path, unless the params specify one (e.g., to write the same data in two formats). Datasets which are missing,
+    were generated with different parameters, or whose content does not match the
+    recorded checksum (e.g. after an interrupted generation) are regenerated.
+    Checksums are only recomputed for files modified since they were recorded.
+    """
+    if os.path.exists(dataset_manifest_path):
+        manifest = read_yaml(dataset_manifest_path) or dict()
+    else:
+        manifest = dict()
 
+    jobs = []
+    entries = []
+    # valid datasets with a new modification time (e.g., after copying)
+    rehashed = []
+    for path, func, params in datasets:
+        seed = params.get("seed", dataset_seed(path))
+        entry = _dataset_entry(func, params, seed)
+        manifest_entry = manifest.get(os.path.basename(path))
+        if _is_valid_dataset(path, entry, manifest_entry):
+            if os.path.getmtime(path) != manifest_entry.get("mtime"):
+                rehashed.append(path)
+            continue
+        if os.path.exists(path):
+            print_warn(" *** Dataset [{}] is outdated or corrupt, regenerating...".format(path))
+        else:
+            print_warn(" *** Generating data [{}], this might take a while...".format(path))
+        ensure_dir_exists(path)
+        kwargs = dict(params)
+        kwargs["seed"] = seed
+        jobs.append((func, path, kwargs))
+        entries.append((path, entry))
 
-def generate_matrix(path, N):
-    X = np.random.uniform(-1, 1, size=(N, N))
-    np.savetxt(path, X, delimiter=";")
+    if len(jobs) == 0 and len(rehashed) == 0:
+        return
 
+    # the manifest is re-read, other benchmarks may share it
+    results = run_generators(jobs)
+    if os.path.exists(dataset_manifest_path):
+        manifest = read_yaml(dataset_manifest_path) or dict()
+    for path in rehashed:
+        manifest[os.path.basename(path)]["mtime"] = os.path.getmtime(path)
+    for (path, entry), (num_bytes, mtime, sha1) in zip(entries, results):
+        entry["bytes"] = num_bytes
+        entry["mtime"] = mtime
+        entry["sha1"] = sha1
+        manifest[os.path.basename(path)] = entry
+    write_yaml(dataset_manifest_path, manifest)
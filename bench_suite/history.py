@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+from collections import defaultdict
+
+import numpy as np
+
+from .stats import mann_whitney_u
+from .utils import print_bold, print_error, print_warn
+
+
+class Comparison(object):
+    """ Result of comparing the run times of one (entry, size, threads, stage) cell between two sessions. """
+
+    def __init__(self, cell, session_id, baseline_id, values, baseline_values, alpha, min_slowdown):
+        self.cell = cell
+        self.session_id = session_id
+        self.baseline_id = baseline_id
+        self.median = np.median(values)
+        self.baseline_median = np.median(baseline_values)
+        self.ratio = self.median / self.baseline_median
+        _, self.p_slower = mann_whitney_u(values, baseline_values)
+        _, self.p_faster = mann_whitney_u(baseline_values, values)
+        self.is_regression = self.p_slower < alpha and self.ratio > 1 + min_slowdown
+        self.is_improvement = self.p_faster < alpha and self.ratio < 1 - min_slowdown
+
+    def __str__(self):
+        language, benchmark, impl, size, threads, stage = self.cell
+        if threads != 1:
+            size = "{} ({} threads)".format(size, threads)
+        return "{} / {} / {} / {} / {}: {:.4g} sec -> {:.4g} sec ({:+.1f} %, p = {:.3g}, session {} vs {})".format(
+            language, benchmark, impl, size, stage,
+            self.baseline_median, self.median, (self.ratio - 1) * 100,
+            self.p_slower if self.ratio >= 1 else self.p_faster,
+            self.session_id, self.baseline_id,
+        )
+
+
+def group_history(history, include_throttled=False):
+    """
+    Groups the history rows by session and cell, i.e., returns a dict
+    "(session_id, cell) => list of values" with cell = (language, benchmark, impl, size, threads, stage),
+    including a "Total" stage summing up all stages of a run, a dict
+    "(session_id, language, benchmark, impl) => set of (impl commit, toolchain)",
+    and a dict "session_id => number of excluded throttled runs".
+    """
+    values = defaultdict(list)
+    totals = defaultdict(float)
+    versions = defaultdict(set)
+    throttled_runs = defaultdict(set)
+    for session_id, language, benchmark, impl, size, run_id, threads, stage, value, impl_commit, toolchain, throttled in history:
+        if throttled and not include_throttled:
+            throttled_runs[session_id].add((language, benchmark, impl, size, run_id, threads))
+            continue
+        values[(session_id, (language, benchmark, impl, size, threads, stage))].append(value)
+        totals[(session_id, (language, benchmark, impl, size, threads, "Total"), run_id)] += value
+        versions[(session_id, language, benchmark, impl)].add((impl_commit, toolchain))
+    for (session_id, cell, run_id), total in sorted(totals.iteritems()):
+        values[(session_id, cell)].append(total)
+    num_throttled = {session_id: len(runs) for session_id, runs in throttled_runs.iteritems()}
+    return values, versions, num_throttled
+
+
+def compare_sessions(store, session_id=None, baseline_id=None, alpha=0.05, min_slowdown=0.05, include_throttled=False):
+    """
+    Compares the run times of a session (default: the latest one) against a baseline
+    session. Without an explicit baseline, every cell is compared to the most recent
+    earlier session containing that cell. A cell is a regression if it is slower by
+    more than min_slowdown (relative to the baseline median), and a one-sided
+    Mann-Whitney U test rejects "not slower" at significance level alpha.
+    Runs which have been throttled are excluded, unless include_throttled is set.
+    Returns the list of all comparisons.
+    """
+    values, versions, num_throttled = group_history(store.load_history(), include_throttled)
+    if len(values) == 0:
+        print_error("No history available.")
+        return []
+
+    if session_id is None:
+        session_id = max([sid for sid, _ in values])
+
+    sessions_per_cell = defaultdict(list)
+    for sid, cell in values:
+        sessions_per_cell[cell].append(sid)
+
+    comparisons = []
+    for cell in sorted(sessions_per_cell):
+        sessions = sessions_per_cell[cell]
+        if session_id not in sessions:
+            continue
+        if baseline_id is None:
+            earlier_sessions = [sid for sid in sessions if sid < session_id]
+            if len(earlier_sessions) == 0:
+                continue
+            cell_baseline_id = max(earlier_sessions)
+        elif baseline_id in sessions:
+            cell_baseline_id = baseline_id
+        else:
+            continue
+        comparisons.append(Comparison(
+            cell, session_id, cell_baseline_id,
+            values[(session_id, cell)], values[(cell_baseline_id, cell)],
+            alpha, min_slowdown,
+        ))
+
+    print_bold("\nComparing session {} against {} ({} cells, alpha = {}, min. slowdown = {:.1f} %)".format(
+        session_id,
+        "session {}".format(baseline_id) if baseline_id is not None else "the previous sessions",
+        len(comparisons), alpha, min_slowdown * 100,
+    ))
+
+    compared_sessions = set([session_id] + [c.baseline_id for c in comparisons])
+    for sid in sorted(compared_sessions):
+        if num_throttled.get(sid, 0) > 0:
+            print_warn(" *** Excluded {} throttled runs of session {} (use --include-throttled to keep them).".format(
+                num_throttled[sid], sid
+            ))
+
+    improvements = [c for c in comparisons if c.is_improvement]
+    if len(improvements) > 0:
+        print_bold("\nImprovements:")
+        for comparison in improvements:
+            print(comparison)
+
+    regressions = [c for c in comparisons if c.is_regression]
+    if len(regressions) > 0:
+        print_bold("\nRegressions:")
+        for comparison in regressions:
+            print_error(str(comparison))
+            language, benchmark, impl, _, _, _ = comparison.cell
+            old_versions = versions[(comparison.baseline_id, language, benchmark, impl)]
+            new_versions = versions[(comparison.session_id, language, benchmark, impl)]
+            if old_versions != new_versions:
+                for label, entry_versions in [("before", old_versions), ("after", new_versions)]:
+                    for impl_commit, toolchain in sorted(entry_versions):
+                        print("    {}: commit {}, toolchain {}".format(
+                            label, impl_commit, (toolchain or "").replace("\n", "; ")
+                        ))
+    else:
+        print("\nNo significant regressions.")
+
+    return comparisons
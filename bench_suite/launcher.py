@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Minimal launcher for benchmark runs, measuring the wall time and resource usage of a command.
+
+Usage: launcher.py <rusage file> <command> [<args>...]
+
+The command is forked from this small process instead of the framework process:
+A forked child inherits the resident set size of its parent as peak RSS, so
+spawning directly from the framework (with numpy etc. loaded) would put a large
+floor under the peak RSS of every run. The resource usage returned by wait4
+covers the command and all of its waited-for descendants.
+"""
+
+from __future__ import division, print_function
+
+import os
+import sys
+import time
+import errno
+
+
+launcher_path = os.path.abspath(__file__).replace(".pyc", ".py")
+
+
+def read_resource_usage(filename):
+    """ Reads the resource usage written by the launcher, or None if unavailable. """
+    if not os.path.exists(filename):
+        return None
+    resource_usage = dict()
+    with open(filename) as f:
+        for line in f:
+            key, value = line.split()
+            resource_usage[key] = int(value) if value.isdigit() else float(value)
+    return resource_usage
+
+
+def main():
+    rusage_filename = sys.argv[1]
+    command = sys.argv[2:]
+
+    t1 = time.time()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.execvp(command[0], command)
+        finally:
+            os._exit(127)
+
+    while True:
+        try:
+            _, status, rusage = os.wait4(pid, 0)
+            break
+        except OSError as exc:
+            if exc.errno != errno.EINTR:
+                raise
+    t2 = time.time()
+
+    resource_usage = [
+        ("wall_time", t2 - t1),
+        ("peak_rss", rusage.ru_maxrss / 1024),  # Linux reports kB, stored as MB
+        ("user_time", rusage.ru_utime),
+        ("system_time", rusage.ru_stime),
+        ("voluntary_context_switches", rusage.ru_nvcsw),
+        ("involuntary_context_switches", rusage.ru_nivcsw),
+    ]
+    with open(rusage_filename, "w") as f:
+        for key, value in resource_usage:
+            f.write("{} {!r}\n".format(key, value))
+
+    if os.WIFSIGNALED(status):
+        os.kill(os.getpid(), os.WTERMSIG(status))
+    sys.exit(os.WEXITSTATUS(status))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import os
+import json
+import datetime
+import threading
+
+from .utils import read_yaml, write_yaml, ensure_dir_exists
+
+
+class RunManifest(object):
+    """
+    Keeps track of the planned and completed runs of a benchmark session, as a log
+    with one JSON object per line and event ("planned" or "completed"). Events are
+    appended and flushed immediately, so that the log reflects the progress even if
+    the process dies, without rewriting the runs recorded before.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        ensure_dir_exists(path)
+        self._file = open(path, "w")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def run_key(b_entry, size, run_id, threads=1):
+        return {
+            "language": b_entry.language,
+            "benchmark": b_entry.benchmark_name,
+            "impl": b_entry.impl_name,
+            "size": size,
+            "run_id": run_id,
+            "threads": threads,
+        }
+
+    def add_planned(self, runs):
+        events = []
+        for b_entry, size, run_id, threads in runs:
+            event = self.run_key(b_entry, size, run_id, threads)
+            event["event"] = "planned"
+            events.append(event)
+        self._append(events)
+
+    def mark_completed(self, b_entry, size, run_id, status, threads=1):
+        event = self.run_key(b_entry, size, run_id, threads)
+        event["event"] = "completed"
+        event["status"] = status
+        event["finished"] = datetime.datetime.now().isoformat()
+        self._append([event])
+
+    def _append(self, events):
+        lines = "".join([json.dumps(event, sort_keys=True) + "\n" for event in events])
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class RenderManifest(object):
+    """
+    Records a hash of the inputs of every generated output file, so that outputs
+    whose inputs did not change since they were rendered can be skipped.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.exists(path):
+            self.input_hashes = read_yaml(path) or dict()
+        else:
+            self.input_hashes = dict()
+
+    def is_up_to_date(self, output, input_hash):
+        return self.input_hashes.get(output) == input_hash and os.path.exists(output)
+
+    def update(self, output, input_hash):
+        self.input_hashes[output] = input_hash
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        write_yaml(tmp_path, self.input_hashes)
+        os.rename(tmp_path, self.path)
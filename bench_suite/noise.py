@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import os
+import sys
+import glob
+import time
+import threading
+
+from .utils import print_warn, print_error, print_bold
+
+
+# pre-flight thresholds
+max_load_average = 1.0
+swap_check_interval = 1.0
+
+
+def read_sys_value(filename):
+    """ Reads a single value from sysfs/procfs, or returns None if unavailable. """
+    try:
+        with open(filename) as f:
+            return f.read().strip()
+    except (IOError, OSError):
+        return None
+
+
+def read_swap_counters():
+    """ Returns the number of pages swapped in/out since boot, or None if unavailable. """
+    counters = dict()
+    try:
+        with open("/proc/vmstat") as f:
+            for line in f:
+                key, value = line.split()
+                if key in ["pswpin", "pswpout"]:
+                    counters[key] = int(value)
+    except (IOError, OSError):
+        return None
+    return counters.get("pswpin", 0) + counters.get("pswpout", 0)
+
+
+def check_system_noise():
+    """
+    Checks the system for conditions which make run times unstable: background load,
+    CPU frequency governors other than "performance", enabled turbo boost, and swap
+    activity. Returns a list of human readable issues (empty if none were found).
+    """
+    issues = []
+
+    load_1min = os.getloadavg()[0]
+    if load_1min > max_load_average:
+        issues.append("Load average is {:.2f} (threshold: {:.2f}), other processes are competing for the CPUs.".format(
+            load_1min, max_load_average
+        ))
+
+    governors = set(filter(None, [
+        read_sys_value(fn)
+        for fn in glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_governor")
+    ]))
+    non_performance = sorted(governors - set(["performance"]))
+    if len(non_performance) > 0:
+        issues.append("CPU frequency governor is '{}' instead of 'performance'.".format(
+            "', '".join(non_performance)
+        ))
+
+    # acpi-cpufreq exposes "boost", intel_pstate the inverted "no_turbo"
+    if read_sys_value("/sys/devices/system/cpu/cpufreq/boost") == "1" or \
+            read_sys_value("/sys/devices/system/cpu/intel_pstate/no_turbo") == "0":
+        issues.append("Turbo boost is enabled, the clock rate depends on temperature and load.")
+
+    swapped_before = read_swap_counters()
+    if swapped_before is not None:
+        time.sleep(swap_check_interval)
+        swapped_pages = read_swap_counters() - swapped_before
+        if swapped_pages > 0:
+            issues.append("System is swapping ({} pages within {:.0f} sec).".format(
+                swapped_pages, swap_check_interval
+            ))
+
+    return issues
+
+
+def run_noise_check(mode):
+    """
+    Runs the pre-flight check. Mode "warn" reports issues, mode "strict" aborts if
+    there are any, mode "off" skips the check. Returns the list of issues.
+    """
+    if mode == "off":
+        return []
+    print_bold("\nChecking system noise")
+    issues = check_system_noise()
+    for issue in issues:
+        print_warn(" *** " + issue)
+    if len(issues) == 0:
+        print("No issues found.")
+    elif mode == "strict":
+        print_error("Aborting because of system noise (use --noise-check warn to run anyway).")
+        sys.exit(1)
+    return issues
+
+
+class SystemSampler(object):
+    """
+    Background thread sampling the CPU frequencies (of the given CPUs, or all CPUs)
+    and the thermal zone temperatures while a run is executing. A run counts as
+    throttled if the kernel's thermal throttle counters increased, or if any thermal
+    zone reached its passive trip point (where the kernel starts throttling).
+    """
+
+    def __init__(self, cpus=None, interval=0.2):
+        if cpus is None:
+            freq_files = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq")
+            throttle_files = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/thermal_throttle/*_throttle_count")
+        else:
+            freq_files = [
+                "/sys/devices/system/cpu/cpu{}/cpufreq/scaling_cur_freq".format(cpu) for cpu in cpus
+            ]
+            throttle_files = sum([
+                glob.glob("/sys/devices/system/cpu/cpu{}/thermal_throttle/*_throttle_count".format(cpu))
+                for cpu in cpus
+            ], [])
+        self.freq_files = [fn for fn in freq_files if os.path.exists(fn)]
+        self.throttle_files = throttle_files
+        self.thermal_zones = sorted(glob.glob("/sys/class/thermal/thermal_zone[0-9]*"))
+        self.passive_trip_points = self._read_passive_trip_points()
+        self.interval = interval
+
+        self.frequencies = []
+        self.temperatures = []
+        self._throttle_counts_before = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _read_passive_trip_points(self):
+        trip_points = dict()
+        for zone in self.thermal_zones:
+            for type_file in glob.glob(os.path.join(zone, "trip_point_*_type")):
+                if read_sys_value(type_file) == "passive":
+                    temp = read_sys_value(type_file.replace("_type", "_temp"))
+                    if temp is not None and int(temp) > 0:
+                        trip_points[zone] = int(temp) / 1000
+        return trip_points
+
+    def _read_throttle_counts(self):
+        return sum([int(read_sys_value(fn) or 0) for fn in self.throttle_files])
+
+    def _sample(self):
+        for fn in self.freq_files:
+            value = read_sys_value(fn)
+            if value is not None:
+                self.frequencies.append(int(value) / 1000)
+        for zone in self.thermal_zones:
+            value = read_sys_value(os.path.join(zone, "temp"))
+            if value is not None:
+                self.temperatures.append((zone, int(value) / 1000))
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            self._sample()
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        self._throttle_counts_before = self._read_throttle_counts()
+        self._thread = threading.Thread(target=self._loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """ Stops sampling and returns the summary of the samples as a dict. """
+        self._stop_event.set()
+        self._thread.join()
+        self._sample()
+
+        throttle_events = self._read_throttle_counts() - self._throttle_counts_before
+        reached_trip_point = any(
+            temp >= self.passive_trip_points[zone]
+            for zone, temp in self.temperatures
+            if zone in self.passive_trip_points
+        )
+        summary = {
+            "throttle_events": throttle_events,
+            "throttled": throttle_events > 0 or reached_trip_point,
+        }
+        if len(self.frequencies) > 0:
+            summary["freq_min_mhz"] = min(self.frequencies)
+            summary["freq_mean_mhz"] = sum(self.frequencies) / len(self.frequencies)
+        if len(self.temperatures) > 0:
+            summary["temp_max_c"] = max([temp for _, temp in self.temperatures])
+        return summary
+
+
+def exclude_throttled_runs(runs):
+    """ Filters the runs (as loaded from the result store) which were not throttled. """
+    return {
+        key: [run for run in entry_runs if not run.get("throttled", False)]
+        for key, entry_runs in runs.iteritems()
+    }
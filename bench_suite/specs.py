@@ -107,20 +107,45 @@ def get_line_from_command(command, lineno=0):
     return lines[lineno]
 
 
-def get_software_specs():
-    spec_getters = [
-        ("GCC", lambda: get_line_from_command("gcc --version")),
-        ("Clang", lambda: get_line_from_command("clang++-3.8 --version")),
-        ("JVM", lambda: get_line_from_command("java -version", 1)),
-        ("Python", lambda: get_line_from_command("python --version")),
-        ("Go", lambda: get_line_from_command("go version")),
-        ("Rust", lambda: get_line_from_command("rustc --version")),
-        ("Nim", lambda: get_line_from_command("nim --version")),
-    ]
+software_version_getters = [
+    ("GCC", lambda: get_line_from_command("gcc --version")),
+    ("Clang", lambda: get_line_from_command("clang++-3.8 --version")),
+    ("JVM", lambda: get_line_from_command("java -version", 1)),
+    ("Python", lambda: get_line_from_command("python --version")),
+    ("Go", lambda: get_line_from_command("go version")),
+    ("Rust", lambda: get_line_from_command("rustc --version")),
+    ("Nim", lambda: get_line_from_command("nim --version")),
+]
+
+# Software specs which affect the build output of an implementation language
+toolchains_per_language = {
+    "C++": ["GCC", "Clang"],
+    "Go": ["Go"],
+    "Nim": ["Nim", "GCC", "Clang"],
+    "Python": ["Python"],
+    "Rust": ["Rust"],
+    "Scala": ["JVM"],
+}
 
+
+def get_software_specs():
     specs = [
         (label, secure_execution(func, label))
-        for label, func in spec_getters
+        for label, func in software_version_getters
     ]
     return specs
 
+
+_toolchain_version_cache = dict()
+
+
+def get_toolchain_version(language):
+    """ Returns a string identifying the versions of all tools used to build a language. """
+    if language not in _toolchain_version_cache:
+        getters = dict(software_version_getters)
+        labels = toolchains_per_language.get(language, [])
+        _toolchain_version_cache[language] = "\n".join([
+            "{}: {}".format(label, secure_execution(getters[label], label))
+            for label in labels
+        ])
+    return _toolchain_version_cache[language]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import math
+
+import numpy as np
+
+
+def bootstrap_median_ci(values, confidence=0.95, num_resamples=1000, random_state=None):
+    """
+    Percentile bootstrap confidence interval of the median. All resamples are
+    drawn at once as a (num_resamples, n) index matrix. A fixed seed is used by
+    default, so that the interval is reproducible for the same values.
+    Returns None for less than two values.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n < 2:
+        return None
+    if random_state is None:
+        random_state = np.random.RandomState(0)
+    indices = random_state.randint(0, n, size=(num_resamples, n))
+    medians = np.median(values[indices], axis=1)
+    alpha = (1 - confidence) / 2
+    low, high = np.percentile(medians, [100 * alpha, 100 * (1 - alpha)])
+    return low, high
+
+
+def relative_ci_width(values, confidence=0.95):
+    """
+    Width of the bootstrap confidence interval of the median (the same interval
+    which is reported by summarize) relative to the median, or infinity if the
+    interval cannot be determined yet.
+    """
+    ci = bootstrap_median_ci(values, confidence)
+    if ci is None:
+        return float("inf")
+    median = np.median(values)
+    if median <= 0:
+        return float("inf")
+    return (ci[1] - ci[0]) / median
+
+
+def outlier_mask(values, k=1.5):
+    """ Flags values outside of Tukey's fences, i.e., more than k IQRs beyond the quartiles. """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return np.zeros(0, dtype=bool)
+    q1, q3 = np.percentile(values, [25, 75])
+    iqr = q3 - q1
+    return (values < q1 - k * iqr) | (values > q3 + k * iqr)
+
+
+def summarize(values, confidence=0.95):
+    """
+    Robust summary statistics of a group of measurements: median, quartiles,
+    IQR, median absolute deviation, bootstrap CI of the median, and the number
+    of outliers. Returns None for an empty group.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n == 0:
+        return None
+    median = np.median(values)
+    q1, q3 = np.percentile(values, [25, 75])
+    ci = bootstrap_median_ci(values, confidence)
+    if ci is None:
+        ci = (median, median)
+    return {
+        "n": n,
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "mad": np.median(np.abs(values - median)),
+        "ci_low": ci[0],
+        "ci_high": ci[1],
+        "num_outliers": int(outlier_mask(values).sum()),
+    }
+
+
+def rank_ranges(summaries):
+    """
+    Determines the range of ranks that each item can take given the uncertainty of
+    its median: An item is only considered faster (slower) than another if their
+    confidence intervals do not overlap. Takes a dict "key => summary" and returns
+    a dict "key => (best rank, worst rank)".
+    """
+    keys = list(summaries.keys())
+    ci_low = np.array([summaries[key]["ci_low"] for key in keys])
+    ci_high = np.array([summaries[key]["ci_high"] for key in keys])
+    # definitely_faster[i, j]: item j is faster than item i beyond doubt
+    definitely_faster = ci_high[np.newaxis, :] < ci_low[:, np.newaxis]
+    definitely_slower = ci_low[np.newaxis, :] > ci_high[:, np.newaxis]
+    best = definitely_faster.sum(axis=1) + 1
+    worst = len(keys) - definitely_slower.sum(axis=1)
+    return {
+        key: (int(best[i]), int(worst[i])) for i, key in enumerate(keys)
+    }
+
+
+def average_ranks(values):
+    """ Ranks starting at 1, tied values get the average of their ranks. """
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(values, kind="mergesort")
+    _, first_index, counts = np.unique(values[order], return_index=True, return_counts=True)
+    ranks = np.empty(len(values))
+    ranks[order] = np.repeat(first_index + (counts + 1) / 2, counts)
+    return ranks
+
+
+def mann_whitney_u(x, y):
+    """
+    One-sided Mann-Whitney U test whether the values of x tend to be larger than
+    the values of y. Uses the normal approximation with tie and continuity
+    correction, which is rough for very few runs. Returns (U, p-value).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n1 = len(x)
+    n2 = len(y)
+    n = n1 + n2
+    if n1 == 0 or n2 == 0:
+        return None, 1.0
+    values = np.concatenate([x, y])
+    u = average_ranks(values)[:n1].sum() - n1 * (n1 + 1) / 2
+    _, tie_counts = np.unique(values, return_counts=True)
+    variance = n1 * n2 / 12 * ((n + 1) - (tie_counts ** 3 - tie_counts).sum() / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def fit_power_law(sizes, values):
+    """
+    Fits values = constant * sizes^exponent by least squares in log-log space.
+    Returns (exponent, constant, r^2), or None if there are less than two
+    distinct positive sizes with positive values.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    values = np.asarray(values, dtype=float)
+    valid = (sizes > 0) & (values > 0)
+    if len(np.unique(sizes[valid])) < 2:
+        return None
+    log_sizes = np.log(sizes[valid])
+    log_values = np.log(values[valid])
+    exponent, log_constant = np.polyfit(log_sizes, log_values, 1)
+    residuals = log_values - (exponent * log_sizes + log_constant)
+    total_variance = ((log_values - log_values.mean()) ** 2).sum()
+    r_squared = 1 - (residuals ** 2).sum() / total_variance if total_variance > 0 else 1.0
+    return exponent, math.exp(log_constant), r_squared
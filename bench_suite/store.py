@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import os
+import json
+import sqlite3
+import datetime
+import threading
+from collections import defaultdict
+
+from .base import get_size_ladder, read_stage_runtimes, read_run_meta
+from .utils import ensure_dir_exists
+
+
+run_columns = [
+    "language", "benchmark_id", "benchmark", "impl_id", "impl", "size", "run_id", "threads",
+    "status", "timeout", "wall_time", "finished", "meta",
+]
+
+schema = """
+CREATE TABLE IF NOT EXISTS runs (
+    language TEXT NOT NULL,
+    benchmark_id INTEGER NOT NULL,
+    benchmark TEXT NOT NULL,
+    impl_id INTEGER NOT NULL,
+    impl TEXT NOT NULL,
+    size TEXT NOT NULL,
+    run_id INTEGER NOT NULL,
+    threads INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL,
+    timeout REAL,
+    wall_time REAL,
+    finished TEXT,
+    meta TEXT,
+    PRIMARY KEY (language, benchmark, impl, size, run_id, threads)
+);
+CREATE TABLE IF NOT EXISTS stage_times (
+    language TEXT NOT NULL,
+    benchmark TEXT NOT NULL,
+    impl TEXT NOT NULL,
+    size TEXT NOT NULL,
+    run_id INTEGER NOT NULL,
+    threads INTEGER NOT NULL DEFAULT 1,
+    stage_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (language, benchmark, impl, size, run_id, threads, stage)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    git_commit TEXT,
+    software_specs TEXT
+);
+CREATE TABLE IF NOT EXISTS history (
+    session_id INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    benchmark TEXT NOT NULL,
+    impl TEXT NOT NULL,
+    size TEXT NOT NULL,
+    run_id INTEGER NOT NULL,
+    threads INTEGER NOT NULL DEFAULT 1,
+    stage TEXT NOT NULL,
+    value REAL NOT NULL,
+    impl_commit TEXT,
+    toolchain TEXT,
+    throttled INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, language, benchmark, impl, size, run_id, threads, stage)
+);
+"""
+
+# columns added to existing tables, databases lacking them are migrated
+added_columns = {
+    "runs": ["threads"],
+    "stage_times": ["threads"],
+    "history": ["threads", "throttled"],
+}
+
+
+def entry_key(b_entry):
+    return (b_entry.language, b_entry.benchmark_name, b_entry.impl_name)
+
+
+class ResultStore(object):
+    """
+    SQLite database holding the results of all runs: One row per run in `runs`
+    (status and meta data recorded by the framework), and one row per run and
+    stage in `stage_times`. Re-running a run replaces its previous result.
+    Runs are identified by entry, size, run id, and the number of threads.
+
+    In addition, the stage times of every benchmark session are kept in `history`,
+    along with the implementation commit and toolchain of each run, and whether
+    the run has been throttled. A session
+    is described in `sessions` (start time, repository commit, software specs).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        ensure_dir_exists(path)
+        # runs are recorded from several worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.text_factory = str
+        self.session_id = None
+        with self._lock, self._conn:
+            self._create_tables()
+
+    def _create_tables(self):
+        """
+        Creates the tables. Tables of databases written before thread counts (or the
+        throttling of runs) were recorded are rebuilt with the new schema, their runs
+        count as single-threaded (and not throttled).
+        """
+        tables = [row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        outdated = []
+        for table in ["runs", "stage_times", "history"]:
+            if table not in tables:
+                continue
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info({})".format(table))]
+            if any(column not in columns for column in added_columns[table]):
+                self._conn.execute("ALTER TABLE {0} RENAME TO {0}_outdated".format(table))
+                outdated.append((table, columns))
+        self._conn.executescript(schema)
+        for table, columns in outdated:
+            self._conn.execute("INSERT INTO {0} ({1}) SELECT {1} FROM {0}_outdated".format(
+                table, ", ".join(columns)
+            ))
+            self._conn.execute("DROP TABLE {}_outdated".format(table))
+
+    def add_run(self, b_entry, size, run_id, run_meta, stage_runtimes=None, stage_names=None):
+        """
+        Records a run. stage_runtimes are the values reported by the implementation
+        for stage_names, or None if the run has no valid output. If a session has
+        been started, valid runs are added to its history as well.
+        """
+        threads = run_meta.get("threads", 1)
+        key = entry_key(b_entry) + (size, run_id, threads)
+        row = (
+            b_entry.language, b_entry.benchmark_id, b_entry.benchmark_name,
+            b_entry.impl_id, b_entry.impl_name, size, run_id, threads,
+            run_meta["status"],
+            run_meta.get("timeout"),
+            run_meta.get("wall_time"),
+            run_meta.get("finished") or datetime.datetime.now().isoformat(),
+            json.dumps(run_meta, sort_keys=True),
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM stage_times WHERE language=? AND benchmark=? AND impl=? AND size=? AND run_id=? AND threads=?",
+                key
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs ({}) VALUES ({})".format(
+                    ", ".join(run_columns), ", ".join(["?"] * len(run_columns))
+                ),
+                row
+            )
+            if stage_runtimes is not None:
+                self._conn.executemany(
+                    "INSERT INTO stage_times VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        key + (stage_id, stage, value)
+                        for stage_id, (stage, value) in enumerate(zip(stage_names, stage_runtimes), 1)
+                    ]
+                )
+            if stage_runtimes is not None and self.session_id is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (self.session_id,) + key + (
+                            stage, value, run_meta.get("impl_commit"), run_meta.get("toolchain"),
+                            int(run_meta.get("throttled", False)),
+                        )
+                        for stage, value in zip(stage_names, stage_runtimes)
+                    ]
+                )
+
+    def delete_runs_after(self, b_entry, size, threads, num_runs):
+        """
+        Deletes the runs of a cell with a run id larger than num_runs, i.e., runs left
+        over from earlier sessions which executed more repetitions. The history is kept.
+        """
+        key = entry_key(b_entry) + (size, threads, num_runs)
+        with self._lock, self._conn:
+            for table in ["runs", "stage_times"]:
+                self._conn.execute(
+                    "DELETE FROM {} WHERE language=? AND benchmark=? AND impl=? AND size=? AND threads=? AND run_id>?".format(table),
+                    key
+                )
+
+    def start_session(self, git_commit, software_specs):
+        """ Registers a new benchmark session, which subsequent runs are recorded to. """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO sessions (started, git_commit, software_specs) VALUES (?, ?, ?)",
+                (datetime.datetime.now().isoformat(), git_commit, json.dumps(software_specs))
+            )
+            self.session_id = cursor.lastrowid
+        return self.session_id
+
+    def resume_session(self, git_commit, software_specs):
+        """ Continues recording to the latest session, or starts one if there is none. """
+        self.session_id = self.latest_session_id()
+        if self.session_id is None:
+            return self.start_session(git_commit, software_specs)
+        return self.session_id
+
+    def latest_session_id(self):
+        with self._lock:
+            return self._conn.execute("SELECT MAX(session_id) FROM sessions").fetchone()[0]
+
+    def list_sessions(self):
+        """ Returns (session_id, started, git_commit, software specs, number of runs) of all sessions. """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.session_id, s.started, s.git_commit, s.software_specs, "
+                "(SELECT COUNT(DISTINCT language || benchmark || impl || size || run_id || '/' || threads) "
+                "FROM history h WHERE h.session_id = s.session_id) "
+                "FROM sessions s ORDER BY s.session_id"
+            ).fetchall()
+        return [
+            (session_id, started, git_commit, json.loads(software_specs), num_runs)
+            for session_id, started, git_commit, software_specs, num_runs in rows
+        ]
+
+    def load_history(self):
+        """
+        Loads the history of all sessions in a single query, as a list of
+        (session_id, language, benchmark, impl, size, run_id, threads, stage, value, impl_commit, toolchain, throttled).
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT session_id, language, benchmark, impl, size, run_id, threads, stage, value, impl_commit, toolchain, throttled "
+                "FROM history ORDER BY session_id, language, benchmark, impl, size, run_id, threads"
+            ).fetchall()
+
+    def get_status(self, b_entry, size, run_id, threads=1):
+        """ Returns the status of a recorded run, or None if the run is unknown. """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM runs WHERE language=? AND benchmark=? AND impl=? AND size=? AND run_id=? AND threads=?",
+                entry_key(b_entry) + (size, run_id, threads)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def load_runs(self, b_entry=None):
+        """
+        Loads all runs (optionally only those of one entry) in a single query.
+        Returns a dict "(language, benchmark, impl) => list of runs", where each
+        run is the dict of its meta data plus size, run_id, threads, and "stages => value".
+        """
+        query = (
+            "SELECT r.language, r.benchmark, r.impl, r.size, r.run_id, r.threads, r.meta, s.stage, s.value "
+            "FROM runs r LEFT JOIN stage_times s "
+            "ON r.language = s.language AND r.benchmark = s.benchmark AND r.impl = s.impl "
+            "AND r.size = s.size AND r.run_id = s.run_id AND r.threads = s.threads"
+        )
+        params = ()
+        if b_entry is not None:
+            query += " WHERE r.language=? AND r.benchmark=? AND r.impl=?"
+            params = entry_key(b_entry)
+        query += " ORDER BY r.language, r.benchmark, r.impl, r.size, r.run_id, r.threads, s.stage_id"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        runs = defaultdict(list)
+        last_run_key = None
+        for language, benchmark, impl, size, run_id, threads, meta, stage, value in rows:
+            run_key = (language, benchmark, impl, size, run_id, threads)
+            if run_key != last_run_key:
+                run = json.loads(meta)
+                run["size"] = size
+                run["run_id"] = run_id
+                run["threads"] = threads
+                run["stages"] = dict()
+                runs[(language, benchmark, impl)].append(run)
+                last_run_key = run_key
+            if stage is not None:
+                runs[(language, benchmark, impl)][-1]["stages"][stage] = value
+        return runs
+
+    def list_entries(self):
+        """ Returns (language, benchmark_id, benchmark, impl_id, impl) of all entries with results. """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT DISTINCT language, benchmark_id, benchmark, impl_id, impl FROM runs"
+            ).fetchall()
+
+    def close(self):
+        self._conn.close()
+
+
+def import_result_files(store, benchmark_entries, meta_data_of):
+    """
+    Imports results from the directory layout "results/<lang>/<benchmark>/<impl>"
+    (stdout_run_* files with their meta_run_*.yml). meta_data_of returns the
+    benchmark class of an entry. Returns the number of runs.
+    """
+    num_imported = 0
+    for b_entry in benchmark_entries:
+        meta_data = meta_data_of(b_entry)
+        stage_names = meta_data.stages[1:]
+        for size in get_size_ladder(meta_data):
+            for fn in b_entry.result_files(size):
+                run_id = int(fn.rsplit("_", 1)[1])
+                run_meta = read_run_meta(fn)
+                run_meta.setdefault("status", "ok")
+                if "finished" not in run_meta:
+                    run_meta["finished"] = datetime.datetime.fromtimestamp(
+                        os.path.getmtime(fn)
+                    ).isoformat()
+                stage_runtimes = None
+                if run_meta["status"] == "ok":
+                    stage_runtimes = read_stage_runtimes(fn, len(stage_names))
+                    if stage_runtimes is None:
+                        run_meta["status"] = "failed"
+                store.add_run(b_entry, size, run_id, run_meta, stage_runtimes, stage_names)
+                num_imported += 1
+    return num_imported
@@ -3,7 +3,18 @@
 from __future__ import division, print_function
 
 import os
+import time
 import errno
+import signal
+import hashlib
+import subprocess
+import threading
+
+import yaml
+
+
+# Serializes console output of concurrently running jobs
+console_lock = threading.RLock()
 
 
 class AnsiColors:
@@ -46,6 +57,17 @@ def write_file(filename, text):
         f.write(text)
 
 
+def read_yaml(filename):
+    with open(filename) as f:
+        return yaml.safe_load(f)
+
+
+def write_yaml(filename, data):
+    ensure_dir_exists(filename)
+    with open(filename, 'w') as f:
+        yaml.safe_dump(data, f, default_flow_style=False)
+
+
 def ensure_dir_exists(path):
     dir_path = os.path.dirname(path)
     try:
@@ -64,3 +86,89 @@ def write_csv_with_schema(filename, rows, schema):
         for row in rows:
             out_row = ";".join([str(row[field]) for field in schema])
             f.write(out_row + "\n")
+
+
+def list_source_files(path):
+    """
+    Lists all files below a path which are not ignored by git, i.e., it
+    excludes build artifacts. Falls back to a plain directory walk if the
+    path is not under version control.
+    """
+    try:
+        with open(os.devnull, "w") as devnull:
+            output = subprocess.check_output(
+                ["git", "ls-files", "--cached", "--others", "--exclude-standard", "--", "."],
+                cwd=path,
+                stderr=devnull,
+            )
+        files = [os.path.join(path, fn) for fn in output.splitlines()]
+    except (OSError, subprocess.CalledProcessError):
+        files = []
+        for dir_path, dir_names, file_names in os.walk(path):
+            files += [os.path.join(dir_path, fn) for fn in file_names]
+    return sorted([fn for fn in files if os.path.isfile(fn)])
+
+
+def get_git_commit(path="."):
+    """
+    Returns the commit of the last change of a path, with a "-dirty" suffix if the
+    path has uncommitted changes, or None if the path is not under version control.
+    """
+    try:
+        with open(os.devnull, "w") as devnull:
+            commit = subprocess.check_output(
+                ["git", "log", "-1", "--format=%H", "--", "."],
+                cwd=path,
+                stderr=devnull,
+            ).strip()
+            changes = subprocess.check_output(
+                ["git", "status", "--porcelain", "--", "."],
+                cwd=path,
+                stderr=devnull,
+            ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    if commit == "":
+        return None
+    return commit + ("-dirty" if changes != "" else "")
+
+
+def hash_files(paths, extra_data=()):
+    """ Computes a SHA1 over the names and contents of files (plus optional strings). """
+    h = hashlib.sha1()
+    for path in paths:
+        h.update(os.path.normpath(path) + "\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(block)
+        else:
+            h.update("<missing>")
+        h.update("\0")
+    for data in extra_data:
+        h.update(data + "\0")
+    return h.hexdigest()
+
+
+def wait_with_timeout(p, timeout=None, poll_interval=0.05):
+    """
+    Waits for a Popen process, which must be the leader of its own process group.
+    If the timeout (in seconds) expires, the entire process group is killed.
+    Returns whether the process has been killed.
+    """
+    if timeout is None:
+        p.wait()
+        return False
+
+    deadline = time.time() + timeout
+    while p.poll() is None:
+        if time.time() > deadline:
+            try:
+                os.killpg(p.pid, signal.SIGKILL)
+            except OSError as exc:
+                if exc.errno != errno.ESRCH:
+                    raise
+            p.wait()
+            return True
+        time.sleep(poll_interval)
+    return False
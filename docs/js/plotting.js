@@ -56,9 +56,16 @@ function extractLangAndSuffix(data, colLang, colSuffix) {
 }
 
 
-function visualizeCsv(csvFile, selector, scaleLinear) {
+function visualizeCsv(csvFile, selector, scaleLinear, quantity, unit, throughput) {
   console.log("Rendering " + csvFile + " into " + selector);
 
+  quantity = quantity || "Runtime";
+  unit = unit || "sec";
+
+  // optional throughput of the stage: { unit: ..., higherIsBetter: ... }
+  throughput = throughput || null;
+  var showThroughput = false;
+
   var numSizes = 3;
   var numRuns = 3;
 
@@ -69,6 +76,10 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
   var colTime = "time";
   var colSize = "size";
   var colSuffix = "descr";
+  var colStatus = "status";
+  var colOutlier = "outlier";
+  var colHue = "hue";
+  var colThroughput = "throughput";
 
   var margins = { l: 150, r: 30, t: 30, b: 90 };
 
@@ -76,12 +87,21 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
   var widthRecommended = clientBoundingRect.right - clientBoundingRect.left;
   console.log("Recommended width: " + widthRecommended)
 
-  function render(data) {
+  function render(allData) {
+
+    var colValue = showThroughput ? colThroughput : colTime;
+    var valueQuantity = showThroughput ? (throughput.higherIsBetter ? "Throughput" : "Time per operation") : quantity;
+    var valueUnit = showThroughput ? throughput.unit : unit;
+    var higherIsBetter = showThroughput && throughput.higherIsBetter;
 
     // var dataLangAndSuffix = extractLangAndSuffix(data, colLang, colSuffix);
     // var dataLang = dataLangAndSuffix[0];
     // var dataSffx = dataLangAndSuffix[1];
-    var dataLang = uniqueMaintainOrder(data, (d) => d[colLang]);
+    var dataLang = uniqueMaintainOrder(allData, (d) => d[colLang]);
+
+    // timed out runs have no value, they are rendered as markers at the right border
+    var data = allData.filter((d) => d[colStatus] != "timeout" && d[colValue] != null);
+    var dataTimeouts = showThroughput ? [] : allData.filter((d) => d[colStatus] == "timeout");
 
     var numRows = dataLang.length;
     console.log(dataLang);
@@ -96,8 +116,8 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
     };
 
     // determine min/max
-    var min = d3.min(data, (d) => d["time"]);
-    var max = d3.max(data, (d) => d["time"]);
+    var min = d3.min(data.length > 0 ? data : dataTimeouts, (d) => d[colValue]);
+    var max = d3.max(data.length > 0 ? data : dataTimeouts, (d) => d[colValue]);
     console.log("min: " + min);
     console.log("max: " + max);
 
@@ -129,20 +149,29 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
     // add tool tip
     function toolTipRender(d, globaldata) {
       // console.log("this = " + this);
+      if (d[colStatus] == "timeout") {
+        return "Language: " + d[colLang] + "</br>" +
+          "Timeout: killed after " + d[colTime] + " sec in class " + d[colSize];
+      }
       var size = d[colSize];
-      var bestTime = Number.MAX_VALUE;
+      var bestTime = higherIsBetter ? -Number.MAX_VALUE : Number.MAX_VALUE;
       for (var i = 0; i < globaldata.length; i++) {
-        if (globaldata[i][colSize] == size && globaldata[i][colTime] < bestTime) {
-          bestTime = globaldata[i][colTime];
+        var isBetter = higherIsBetter ?
+          globaldata[i][colValue] > bestTime :
+          globaldata[i][colValue] < bestTime;
+        if (globaldata[i][colSize] == size && isBetter) {
+          bestTime = globaldata[i][colValue];
         }
       }
       // console.log("Using data: " + globaldata.length + " " + globaldata[0][colTime] + " " + globaldata[1][colTime] + " " + globaldata[1][colTime]);
-      var relativePerformance = (bestTime == d[colTime]) ?
-        "This is the fastest run in class " + size :
-        "Slower than fastest run: " + ((100 * d[colTime] / bestTime) - 100).toFixed(1) + " %"; // + bestTime;
+      var relativePerformance = (bestTime == d[colValue]) ?
+        "This is the best run in class " + size :
+        (higherIsBetter ? "Lower than best run: " : "Higher than best run: ") +
+          Math.abs((100 * d[colValue] / bestTime) - 100).toFixed(1) + " %"; // + bestTime;
       return "Language: " + d[colLang] + "</br>" +
-        "Runtime: " + d[colTime].toFixed(3) + " sec" + "</br>" +
-        relativePerformance;
+        valueQuantity + ": " + d[colValue].toFixed(3) + " " + valueUnit + "</br>" +
+        relativePerformance +
+        (d[colOutlier] ? "</br>Outlier (beyond 1.5 IQR from the quartiles)" : "");
     }
     var tip = d3.tip()
             .attr('class', 'd3-tip')
@@ -177,7 +206,7 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
      .attr("transform",
        "translate("+ (canvasSizeInner.w/2) + "," + (canvasSizeInner.h + 3*rowHeight) + ")"
      )
-     .text("Runtime [sec]");
+     .text(valueQuantity + " [" + valueUnit + "]");
 
     // add language labels
     var labels = g.selectAll(".labels")
@@ -191,21 +220,17 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
         return lang;
       });
 
-    var sizesLookup = {
-      S: "circlerun1",
-      M: "circlerun2",
-      L: "circlerun3",
-    }
-
     // plot run columns
     g.selectAll("circlerun")
      .data(data)
      .enter()
      .append("circle")
-     .attr("cx", function (d, i) { return xScale(d[colTime]); })
+     .attr("cx", function (d, i) { return xScale(d[colValue]); })
      .attr("cy", function (d, i) { return yScale(d[colLang]); })
      .attr("r", markersize)
-     .attr("class", (d) => "circlerun " + sizesLookup[d[colSize]])
+     .attr("class", (d) => "circlerun" + (d[colOutlier] ? " outlierrun" : ""))
+     .style("stroke", (d) => "hsla(" + d[colHue] + ", 78%, 48%, 1)")
+     .style("fill", (d) => "hsla(" + d[colHue] + ", 78%, 48%, 0.1)")
      /*
      .on('mouseover', (d, i) => {
        console.log("mouseover");
@@ -229,15 +254,370 @@ function visualizeCsv(csvFile, selector, scaleLinear) {
         .transition()
         .style("opacity", 1.0);
      });
+
+    // plot timeout markers
+    g.selectAll("timeoutmarker")
+     .data(dataTimeouts)
+     .enter()
+     .append("text")
+     .attr("x", canvasSizeInner.w)
+     .attr("y", function (d, i) { return yScale(d[colLang]); })
+     .attr("text-anchor", "middle")
+     .attr("dominant-baseline", "central")
+     .attr("class", "timeoutmarker")
+     .text("\u2715")
+     .on('mouseover', function (d) { tip.show(d, data); })
+     .on('mouseout', function (d) { tip.hide(d); });
+  }
+
+  // toggle between run time and throughput, re-rendering the plot
+  function renderWithToggle(allData) {
+    if (throughput != null) {
+      var modes = [["Time", false], ["Throughput", true]];
+      var toggle = d3
+        .select(selector)
+        .append("div")
+        .attr("class", "btn-group btn-group-xs plottoggle");
+      toggle.selectAll("button")
+        .data(modes)
+        .enter()
+        .append("button")
+        .attr("type", "button")
+        .attr("class", (mode) => "btn btn-default" + (mode[1] == showThroughput ? " active" : ""))
+        .text((mode) => mode[0])
+        .on("click", function (mode) {
+          showThroughput = mode[1];
+          toggle.selectAll("button").classed("active", (other) => other[1] == showThroughput);
+          d3.select(selector).select("svg").remove();
+          render(allData);
+        });
+    }
+    render(allData);
   }
 
   function rowFormatter(row) {
     row[colTime] = +row[colTime];
+    row[colOutlier] = +row[colOutlier];
+    row[colHue] = +row[colHue];
+    row[colThroughput] = (row[colThroughput] === undefined || row[colThroughput] === "") ? null : +row[colThroughput];
     return row;
   }
 
   // https://github.com/d3/d3-request/blob/master/README.md#csv
   // https://github.com/d3/d3-dsv#dsv_parse
+  d3.request(csvFile)
+    .mimeType("text/csv")
+    .response(function(xhr) { return d3.dsvFormat(";").parse(xhr.responseText, rowFormatter); })
+    .get(renderWithToggle);
+}
+
+
+function visualizeScalingCsv(csvFile, selector, stage, sizeQuantity) {
+  console.log("Rendering scaling of " + stage + " from " + csvFile + " into " + selector);
+
+  var markersize = 4;
+  var plotHeight = 300;
+
+  var colLang = "label";
+  var colStage = "stage";
+  var colSize = "size";
+  var colMagnitude = "magnitude";
+  var colTime = "time";
+  var colExponent = "exponent";
+  var colConstant = "constant";
+
+  var margins = { l: 80, r: 200, t: 20, b: 60 };
+
+  var clientBoundingRect = document.querySelector(selector).getBoundingClientRect()
+  var widthRecommended = clientBoundingRect.right - clientBoundingRect.left;
+
+  function render(allData) {
+
+    var data = allData.filter((d) => d[colStage] == stage);
+    if (data.length == 0) {
+      return;
+    }
+    var dataLang = uniqueMaintainOrder(data, (d) => d[colLang]);
+
+    var canvasSizeOuter = { w: widthRecommended, h: plotHeight + margins.t + margins.b };
+    var canvasSizeInner = {
+      w: canvasSizeOuter.w - margins.l - margins.r,
+      h: plotHeight
+    };
+
+    var xScale = d3
+      .scaleLog()
+      .range([0, canvasSizeInner.w])
+      .domain(d3.extent(data, (d) => d[colMagnitude]));
+    var yScale = d3
+      .scaleLog()
+      .range([canvasSizeInner.h, 0])
+      .domain(d3.extent(data, (d) => d[colTime]));
+    var colorScale = d3
+      .scaleOrdinal(d3.schemeCategory10)
+      .domain(dataLang);
+
+    var svg = d3
+      .select(selector)
+      .append("svg")
+      .attr("width", canvasSizeOuter.w)
+      .attr("height", canvasSizeOuter.h);
+
+    var g = svg.append("g")
+      .attr("transform", "translate(" + margins.l + ", " + margins.t + ")");
+
+    function toolTipRender(d) {
+      return "Language: " + d[colLang] + "</br>" +
+        "Size: " + d[colSize] + "</br>" +
+        "Median runtime: " + d[colTime].toFixed(3) + " sec</br>" +
+        "Fitted exponent: " + d[colExponent].toFixed(2);
+    }
+    var tip = d3.tip()
+            .attr('class', 'd3-tip')
+            .direction('e')
+            .offset([-2, 15])
+            .html(toolTipRender);
+    g.call(tip);
+
+    // axes
+    g.append("g")
+     .attr("class", "x axis")
+     .attr("transform", "translate(0," + canvasSizeInner.h + ")")
+     .call(d3.axisBottom().scale(xScale).ticks(5, ".1s"));
+    g.append("g")
+     .attr("class", "y axis")
+     .call(d3.axisLeft().scale(yScale).ticks(5, ".1e"));
+
+    g.append("text")
+     .attr("text-anchor", "middle")
+     .attr("transform", "translate(" + (canvasSizeInner.w/2) + "," + (canvasSizeInner.h + 40) + ")")
+     .text(sizeQuantity);
+    g.append("text")
+     .attr("text-anchor", "middle")
+     .attr("transform", "translate(" + (-margins.l + 15) + "," + (canvasSizeInner.h/2) + ") rotate(-90)")
+     .text("Runtime [sec]");
+
+    var line = d3.line()
+      .x((d) => xScale(d[colMagnitude]))
+      .y((d) => yScale(d[colTime]));
+
+    dataLang.forEach(function (lang) {
+      var dataOfLang = data.filter((d) => d[colLang] == lang);
+      var first = dataOfLang[0];
+      var last = dataOfLang[dataOfLang.length - 1];
+
+      // fitted power law, evaluated at the smallest and largest size
+      var fitted = [first, last].map((d) => {
+        var fit = {};
+        fit[colMagnitude] = d[colMagnitude];
+        fit[colTime] = d[colConstant] * Math.pow(d[colMagnitude], d[colExponent]);
+        return fit;
+      });
+      g.append("path")
+       .datum(fitted)
+       .attr("class", "scalingfit")
+       .attr("stroke", colorScale(lang))
+       .attr("d", line);
+
+      g.append("path")
+       .datum(dataOfLang)
+       .attr("class", "scalingline")
+       .attr("stroke", colorScale(lang))
+       .attr("d", line);
+
+      g.selectAll("scalingpoint")
+       .data(dataOfLang)
+       .enter()
+       .append("circle")
+       .attr("cx", (d) => xScale(d[colMagnitude]))
+       .attr("cy", (d) => yScale(d[colTime]))
+       .attr("r", markersize)
+       .attr("fill", colorScale(lang))
+       .on('mouseover', function (d) { tip.show(d); })
+       .on('mouseout', function (d) { tip.hide(d); });
+    });
+
+    // legend
+    g.selectAll("scalinglegend")
+     .data(dataLang)
+     .enter()
+     .append("text")
+     .attr("x", canvasSizeInner.w + 20)
+     .attr("y", (lang, i) => i * 18)
+     .attr("class", "langlabels")
+     .attr("fill", (lang) => colorScale(lang))
+     .text((lang) => {
+       var exponent = data.filter((d) => d[colLang] == lang)[0][colExponent];
+       return lang + ": k = " + exponent.toFixed(2);
+     });
+  }
+
+  function rowFormatter(row) {
+    row[colMagnitude] = +row[colMagnitude];
+    row[colTime] = +row[colTime];
+    row[colExponent] = +row[colExponent];
+    row[colConstant] = +row[colConstant];
+    return row;
+  }
+
+  d3.request(csvFile)
+    .mimeType("text/csv")
+    .response(function(xhr) { return d3.dsvFormat(";").parse(xhr.responseText, rowFormatter); })
+    .get(render);
+}
+
+
+function visualizeThreadScalingCsv(csvFile, selector, column) {
+  console.log("Rendering thread scaling (" + column + ") from " + csvFile + " into " + selector);
+
+  var markersize = 4;
+  var plotHeight = 300;
+
+  var colLang = "series";
+  var colMode = "mode";
+  var colThreads = "threads";
+  var colTime = "time";
+  var colSpeedup = "speedup";
+  var colEfficiency = "efficiency";
+
+  var yLabel = column == colSpeedup ? "Speedup" : "Parallel efficiency";
+
+  // ideal scaling: speedup equal to the number of threads, efficiency of 1
+  function ideal(threads) {
+    return column == colSpeedup ? threads : 1;
+  }
+
+  var margins = { l: 80, r: 200, t: 20, b: 60 };
+
+  var clientBoundingRect = document.querySelector(selector).getBoundingClientRect()
+  var widthRecommended = clientBoundingRect.right - clientBoundingRect.left;
+
+  function render(data) {
+
+    if (data.length == 0) {
+      return;
+    }
+    var dataLang = uniqueMaintainOrder(data, (d) => d[colLang]);
+    var threadCounts = uniqueMaintainOrder(data, (d) => d[colThreads]).sort((a, b) => a - b);
+
+    var canvasSizeOuter = { w: widthRecommended, h: plotHeight + margins.t + margins.b };
+    var canvasSizeInner = {
+      w: canvasSizeOuter.w - margins.l - margins.r,
+      h: plotHeight
+    };
+
+    var xScale = d3
+      .scaleLog()
+      .base(2)
+      .range([0, canvasSizeInner.w])
+      .domain(d3.extent(threadCounts));
+    var yScale = d3
+      .scaleLinear()
+      .range([canvasSizeInner.h, 0])
+      .domain([0, Math.max(d3.max(data, (d) => d[column]), d3.max(threadCounts, ideal)) * 1.05]);
+    var colorScale = d3
+      .scaleOrdinal(d3.schemeCategory10)
+      .domain(dataLang);
+
+    var svg = d3
+      .select(selector)
+      .append("svg")
+      .attr("width", canvasSizeOuter.w)
+      .attr("height", canvasSizeOuter.h);
+
+    var g = svg.append("g")
+      .attr("transform", "translate(" + margins.l + ", " + margins.t + ")");
+
+    function toolTipRender(d) {
+      return "Language: " + d[colLang] + "</br>" +
+        "Scaling: " + d[colMode] + "</br>" +
+        "Threads: " + d[colThreads] + "</br>" +
+        "Median runtime: " + d[colTime].toFixed(3) + " sec</br>" +
+        "Speedup: " + d[colSpeedup].toFixed(2) + "</br>" +
+        "Parallel efficiency: " + (100 * d[colEfficiency]).toFixed(1) + " %";
+    }
+    var tip = d3.tip()
+            .attr('class', 'd3-tip')
+            .direction('e')
+            .offset([-2, 15])
+            .html(toolTipRender);
+    g.call(tip);
+
+    // axes
+    g.append("g")
+     .attr("class", "x axis")
+     .attr("transform", "translate(0," + canvasSizeInner.h + ")")
+     .call(d3.axisBottom().scale(xScale).tickValues(threadCounts).tickFormat(d3.format("d")));
+    g.append("g")
+     .attr("class", "y axis")
+     .call(d3.axisLeft().scale(yScale).ticks(5));
+
+    g.append("text")
+     .attr("text-anchor", "middle")
+     .attr("transform", "translate(" + (canvasSizeInner.w/2) + "," + (canvasSizeInner.h + 40) + ")")
+     .text("Threads");
+    g.append("text")
+     .attr("text-anchor", "middle")
+     .attr("transform", "translate(" + (-margins.l + 15) + "," + (canvasSizeInner.h/2) + ") rotate(-90)")
+     .text(yLabel);
+
+    var line = d3.line()
+      .x((d) => xScale(d[colThreads]))
+      .y((d) => yScale(d[column]));
+
+    var idealPoints = threadCounts.map((threads) => {
+      var point = {};
+      point[colThreads] = threads;
+      point[column] = ideal(threads);
+      return point;
+    });
+    g.append("path")
+     .datum(idealPoints)
+     .attr("class", "scalingfit")
+     .attr("stroke", "#888")
+     .attr("d", line);
+
+    dataLang.forEach(function (lang) {
+      var dataOfLang = data.filter((d) => d[colLang] == lang);
+
+      g.append("path")
+       .datum(dataOfLang)
+       .attr("class", "scalingline")
+       .attr("stroke", colorScale(lang))
+       .attr("d", line);
+
+      g.selectAll("threadpoint")
+       .data(dataOfLang)
+       .enter()
+       .append("circle")
+       .attr("cx", (d) => xScale(d[colThreads]))
+       .attr("cy", (d) => yScale(d[column]))
+       .attr("r", markersize)
+       .attr("fill", colorScale(lang))
+       .on('mouseover', function (d) { tip.show(d); })
+       .on('mouseout', function (d) { tip.hide(d); });
+    });
+
+    // legend
+    g.selectAll("threadlegend")
+     .data(dataLang)
+     .enter()
+     .append("text")
+     .attr("x", canvasSizeInner.w + 20)
+     .attr("y", (lang, i) => i * 18)
+     .attr("class", "langlabels")
+     .attr("fill", (lang) => colorScale(lang))
+     .text((lang) => lang);
+  }
+
+  function rowFormatter(row) {
+    row[colThreads] = +row[colThreads];
+    row[colTime] = +row[colTime];
+    row[colSpeedup] = +row[colSpeedup];
+    row[colEfficiency] = +row[colEfficiency];
+    return row;
+  }
+
   d3.request(csvFile)
     .mimeType("text/csv")
     .response(function(xhr) { return d3.dsvFormat(";").parse(xhr.responseText, rowFormatter); })
@@ -256,6 +636,14 @@ function visualizeCsvStageSummary(csvFile, selector) {
   var colSize = "size";
   var colSuffix = "descr";
   var colStage = "stage";
+  var colCiLow = "ci_low";
+  var colCiHigh = "ci_high";
+  var colIqr = "iqr";
+  var colMad = "mad";
+  var colNumRuns = "num_runs";
+  var colNumOutliers = "num_outliers";
+  var colThroughput = "throughput";
+  var colThroughputUnit = "throughput_unit";
 
   var margins = { l: 150, r: 30, t: 30, b: 90 };
 
@@ -283,8 +671,8 @@ function visualizeCsvStageSummary(csvFile, selector) {
     };
 
     // determine min/max
-    var min = d3.min(data, (d) => d["time"]) * 0.9; // allowing to see a small bar even for the min
-    var max = d3.max(data, (d) => d["time"]);
+    var min = d3.min(data, (d) => Math.min(d["time"], d[colCiLow])) * 0.9; // allowing to see a small bar even for the min
+    var max = d3.max(data, (d) => Math.max(d["time"], d[colCiHigh]));
     console.log("min: " + min);
     console.log("max: " + max);
 
@@ -315,7 +703,11 @@ function visualizeCsvStageSummary(csvFile, selector) {
     // add tool tip
     function toolTipRender(d, globaldata) {
       return "Stage: " + d[colStage] + "</br>" +
-        "Runtime: " + d[colTime].toFixed(3) + " sec";
+        "Runtime (median): " + d[colTime].toFixed(3) + " sec</br>" +
+        "95% CI: " + d[colCiLow].toFixed(3) + " &ndash; " + d[colCiHigh].toFixed(3) + " sec</br>" +
+        "IQR: " + d[colIqr].toFixed(3) + " sec, MAD: " + d[colMad].toFixed(3) + " sec</br>" +
+        "Runs: " + d[colNumRuns] + " (" + d[colNumOutliers] + " outliers)" +
+        (d[colThroughputUnit] != "" ? "</br>Throughput: " + (+d[colThroughput]).toFixed(3) + " " + d[colThroughputUnit] : "");
     }
     var tip = d3.tip()
             .attr('class', 'd3-tip')
@@ -386,10 +778,25 @@ function visualizeCsvStageSummary(csvFile, selector) {
         .transition()
         .style("opacity", 1.0);
      });
+
+    // confidence intervals of the medians as error bars
+    g.selectAll("stageerrorbar")
+     .data(data)
+     .enter()
+     .append("line")
+     .attr("x1", (d) => xScale(d[colCiLow]))
+     .attr("x2", (d) => xScale(d[colCiHigh]))
+     .attr("y1", (d) => yScaleLang(d[colLang]) + yScaleStages(d[colStage]) - yScaleLang.bandwidth()/2 + yScaleStages.bandwidth()/2)
+     .attr("y2", (d) => yScaleLang(d[colLang]) + yScaleStages(d[colStage]) - yScaleLang.bandwidth()/2 + yScaleStages.bandwidth()/2)
+     .attr("class", "errorbar");
   }
 
   function rowFormatter(row) {
     row[colTime] = +row[colTime];
+    row[colCiLow] = +row[colCiLow];
+    row[colCiHigh] = +row[colCiHigh];
+    row[colIqr] = +row[colIqr];
+    row[colMad] = +row[colMad];
     return row;
   }
 
@@ -417,6 +824,14 @@ function visualizeCsvGeneralSummary(csvFile, selector) {
   var colRank = "rank";
   var colRelative = "relative";
   var colUrl = "url";
+  var colPeakRss = "peak_rss";
+  var colCpuTime = "cpu_time";
+  var colCiLow = "time_ci_low";
+  var colCiHigh = "time_ci_high";
+  var colRankBest = "rank_best";
+  var colRankWorst = "rank_worst";
+  var colThroughput = "throughput";
+  var colThroughputUnit = "throughput_unit";
 
   var margins = { l: 150, r: 30, t: 100, b: 50 };
 
@@ -486,8 +901,15 @@ function visualizeCsvGeneralSummary(csvFile, selector) {
 
     // add tool tip
     function toolTipRender(d) {
+      var rankRange = (d[colRankBest] == d[colRankWorst]) ?
+        "" : " (" + d[colRankBest] + " &ndash; " + d[colRankWorst] + " within the 95% CIs)";
       return "Runtime: " + d[colTime].toFixed(3) + " sec <br/>" +
-             "Factor relative to fastest: " + d[colRelative].toFixed(3);
+             "95% CI: " + d[colCiLow].toFixed(3) + " &ndash; " + d[colCiHigh].toFixed(3) + " sec <br/>" +
+             "Rank: " + d[colRank] + rankRange + "<br/>" +
+             "Factor relative to fastest: " + d[colRelative].toFixed(3) + "<br/>" +
+             "Peak RSS: " + d[colPeakRss].toFixed(1) + " MB <br/>" +
+             "CPU time: " + d[colCpuTime].toFixed(3) + " sec" +
+             (d[colThroughputUnit] != "" ? "<br/>Throughput: " + (+d[colThroughput]).toFixed(3) + " " + d[colThroughputUnit] : "");
     }
     var tip = d3
       .tip()
@@ -570,6 +992,10 @@ function visualizeCsvGeneralSummary(csvFile, selector) {
   function rowFormatter(row) {
     row[colTime] = +row[colTime];
     row[colRelative] = +row[colRelative];
+    row[colPeakRss] = +row[colPeakRss];
+    row[colCpuTime] = +row[colCpuTime];
+    row[colCiLow] = +row[colCiLow];
+    row[colCiHigh] = +row[colCiHigh];
     return row;
   }
 
@@ -0,0 +1 @@
+python main.py "$1"
\ No newline at end of file
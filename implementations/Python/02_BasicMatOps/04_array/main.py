@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import sys
+import time
+import operator
+from array import array
+
+
+class TimedContext(object):
+
+    def __enter__(self):
+        self.t1 = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.t2 = time.time()
+        print(self.t2 - self.t1)
+
+
+class ArrayMatrix(object):
+
+    def __init__(self, N, data):
+        self._data = data
+        self._N = N
+
+    def row(self, i):
+        N = self._N
+        return self._data[i*N:(i+1)*N]
+
+    def column(self, j):
+        return self._data[j::self._N]
+
+    def __add__(self, other):
+        assert(self._N == other._N)
+        return ArrayMatrix(self._N, array('d', map(operator.add, self._data, other._data)))
+
+    def __mul__(self, other):
+        assert(self._N == other._N)
+        N = self._N
+        # transposing once makes the inner products run over contiguous memory
+        columns = [other.column(j) for j in xrange(N)]
+        data = array('d')
+        for i in xrange(N):
+            row = self.row(i)
+            data.extend([sum(map(operator.mul, row, column)) for column in columns])
+        return ArrayMatrix(N, data)
+
+    def diag_sum(self):
+        return sum(self._data[::self._N+1])
+
+
+def load_from_data(N, csv_path):
+    data = array('d')
+    with open(csv_path) as f:
+        for line in f:
+            data.extend(map(float, line.split(";")))
+    return ArrayMatrix(N, data)
+
+
+if len(sys.argv) != 4:
+    sys.exit(1)
+
+N = int(sys.argv[1])
+filename_mat_A = sys.argv[2]
+filename_mat_B = sys.argv[3]
+
+with TimedContext():
+    m_A = load_from_data(N, filename_mat_A)
+    m_B = load_from_data(N, filename_mat_B)
+
+with TimedContext():
+    m_add = m_A + m_B
+
+with TimedContext():
+    m_mul = m_A * m_B
+
+print(m_add.diag_sum())
+print(m_mul.diag_sum())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+from __future__ import division, print_function
+
+import sys
+import time
+import multiprocessing
+from array import array
+
+
+class TimedContext(object):
+
+    def __enter__(self):
+        self.t1 = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.t2 = time.time()
+        print(self.t2 - self.t1)
+
+
+def escape_times_of_rows(args):
+    """ Computes the escape times of the rows worker_id, worker_id + num_workers, ... """
+    worker_id, num_workers, width, height, max_iterations = args
+    rows = []
+    for y in xrange(worker_id, height, num_workers):
+        im = -1.25 + 2.5 * y / height
+        row = array('H', [0] * width)
+        for x in xrange(width):
+            c = complex(-2.0 + 2.5 * x / width, im)
+            z = 0j
+            escape_time = max_iterations
+            for i in xrange(max_iterations):
+                z = z * z + c
+                if z.real * z.real + z.imag * z.imag > 4.0:
+                    escape_time = i
+                    break
+            row[x] = escape_time
+        rows.append((y, row))
+    return rows
+
+
+if len(sys.argv) != 5:
+    sys.exit(1)
+
+width = int(sys.argv[1])
+height = int(sys.argv[2])
+max_iterations = int(sys.argv[3])
+num_workers = int(sys.argv[4])
+
+# process startup is not part of any stage
+pool = multiprocessing.Pool(num_workers)
+
+with TimedContext():
+    grid = [None] * height
+    tasks = [
+        (worker_id, num_workers, width, height, max_iterations)
+        for worker_id in xrange(num_workers)
+    ]
+    for rows in pool.map(escape_times_of_rows, tasks):
+        for y, row in rows:
+            grid[y] = row
+
+with TimedContext():
+    histogram = [0] * (max_iterations + 1)
+    for row in grid:
+        for escape_time in row:
+            histogram[escape_time] += 1
+
+pool.close()
+pool.join()
+
+print(histogram[max_iterations])
+print(sum(escape_time * count for escape_time, count in enumerate(histogram)))
@@ -0,0 +1 @@
+python main.py "$@"
\ No newline at end of file
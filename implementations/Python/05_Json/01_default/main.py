@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import sys
+import time
+import json
+
+
+class TimedContext(object):
+
+    def __enter__(self):
+        self.t1 = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.t2 = time.time()
+        print(self.t2 - self.t1)
+
+
+class Aggregate(object):
+
+    def __init__(self):
+        self.num_keys = 0
+        self.checksum = 0.0
+
+    def visit(self, value):
+        if isinstance(value, dict):
+            self.num_keys += len(value)
+            for v in value.itervalues():
+                self.visit(v)
+        elif isinstance(value, list):
+            for v in value:
+                self.visit(v)
+        elif isinstance(value, (int, long, float)) and not isinstance(value, bool):
+            self.checksum += value
+
+
+if len(sys.argv) != 2:
+    sys.exit(1)
+
+with TimedContext():
+    with open(sys.argv[1]) as f:
+        all_data = f.read()
+
+with TimedContext():
+    document = json.loads(all_data)
+
+with TimedContext():
+    aggregate = Aggregate()
+    aggregate.visit(document)
+
+with TimedContext():
+    serialized = json.dumps(document)
+
+print(aggregate.num_keys)
+print("{:.6e}".format(aggregate.checksum))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import sys
+import time
+import json
+import re
+
+
+class Aggregate(object):
+
+    def __init__(self):
+        self.num_keys = 0
+        self.checksum = 0.0
+
+    def visit(self, value):
+        if isinstance(value, dict):
+            self.num_keys += len(value)
+            for v in value.itervalues():
+                self.visit(v)
+        elif isinstance(value, list):
+            for v in value:
+                self.visit(v)
+        elif isinstance(value, (int, long, float)) and not isinstance(value, bool):
+            self.checksum += value
+
+
+def iter_array_elements(f, stage_times, chunk_size=64*1024):
+    """
+    Decodes the elements of a top-level JSON array one by one, reading the file in chunks.
+    Only the current chunk and element are held in memory. The time of reading and
+    decoding is added to stage_times["IO"] and stage_times["Parse"].
+    """
+    decoder = json.JSONDecoder()
+    separators = re.compile(r"[\s,\[]*")
+    buffer = ""
+    pos = 0
+    eof = False
+    while True:
+        t1 = time.time()
+        pos = separators.match(buffer, pos).end()
+        try:
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            element, end = decoder.raw_decode(buffer, pos)
+        except ValueError:
+            # the element is incomplete, unless the file has been read entirely
+            if eof:
+                raise
+            element = None
+        t2 = time.time()
+        stage_times["Parse"] += t2 - t1
+
+        if element is None:
+            chunk = f.read(chunk_size)
+            stage_times["IO"] += time.time() - t2
+            eof = len(chunk) == 0
+            buffer = buffer[pos:] + chunk
+            pos = 0
+        else:
+            pos = end
+            yield element
+
+
+if len(sys.argv) != 2:
+    sys.exit(1)
+
+stage_times = {"IO": 0.0, "Parse": 0.0, "Traverse": 0.0, "Serialize": 0.0}
+
+aggregate = Aggregate()
+serialized_length = 0
+with open(sys.argv[1]) as f:
+    for record in iter_array_elements(f, stage_times):
+        t1 = time.time()
+        aggregate.visit(record)
+        t2 = time.time()
+        # the records are serialized as elements of a JSON array again
+        serialized_length += len(json.dumps(record)) + 1
+        t3 = time.time()
+        stage_times["Traverse"] += t2 - t1
+        stage_times["Serialize"] += t3 - t2
+
+for stage in ["IO", "Parse", "Traverse", "Serialize"]:
+    print(stage_times[stage])
+
+print(aggregate.num_keys)
+print("{:.6e}".format(aggregate.checksum))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import sys
+import time
+from array import array
+
+
+class TimedContext(object):
+
+    def __enter__(self):
+        self.t1 = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.t2 = time.time()
+        print(self.t2 - self.t1)
+
+
+MODULUS = 2147483647
+
+
+def read_ints(path):
+    # 'l' is 64 bit on the supported (LP64) platforms
+    values = array('l')
+    with open(path, "rb") as f:
+        values.fromstring(f.read())
+    return values.tolist()
+
+
+def read_strings(path):
+    with open(path, "rb") as f:
+        return f.read().splitlines()
+
+
+def sampled(values):
+    n = len(values)
+    return [values[i * n // 100] for i in xrange(100)]
+
+
+def int_checksum(values):
+    checksum = 0
+    for v in sampled(values):
+        checksum = (checksum + v % MODULUS) % MODULUS
+    return checksum
+
+
+def string_checksum(values):
+    checksum = 0
+    for s in sampled(values):
+        for c in s:
+            checksum = (checksum * 31 + ord(c)) % MODULUS
+    return checksum
+
+
+if len(sys.argv) != 7:
+    sys.exit(1)
+
+with TimedContext():
+    int_arrays = [read_ints(path) for path in sys.argv[1:4]]
+    string_arrays = [read_strings(path) for path in sys.argv[4:7]]
+
+for values in int_arrays:
+    with TimedContext():
+        values.sort()
+
+for values in string_arrays:
+    with TimedContext():
+        values.sort()
+
+for values in int_arrays:
+    print(int_checksum(values))
+for values in string_arrays:
+    print(string_checksum(values))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import sys
+import time
+
+import numpy as np
+
+
+class TimedContext(object):
+
+    def __enter__(self):
+        self.t1 = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.t2 = time.time()
+        print(self.t2 - self.t1)
+
+
+MODULUS = 2147483647
+
+
+def read_strings(path):
+    # fixed width byte strings, the longest string has 20 characters
+    with open(path, "rb") as f:
+        return np.array(f.read().splitlines(), dtype="S20")
+
+
+def sample_indices(n):
+    return np.arange(100) * n // 100
+
+
+def int_checksum(values):
+    checksum = 0
+    for v in values[sample_indices(len(values))].tolist():
+        checksum = (checksum + v % MODULUS) % MODULUS
+    return checksum
+
+
+def string_checksum(values):
+    checksum = 0
+    for s in values[sample_indices(len(values))].tolist():
+        for c in s:
+            checksum = (checksum * 31 + ord(c)) % MODULUS
+    return checksum
+
+
+if len(sys.argv) != 7:
+    sys.exit(1)
+
+with TimedContext():
+    int_arrays = [np.fromfile(path, dtype="<i8") for path in sys.argv[1:4]]
+    string_arrays = [read_strings(path) for path in sys.argv[4:7]]
+
+for i in xrange(len(int_arrays)):
+    with TimedContext():
+        int_arrays[i] = np.sort(int_arrays[i])
+
+for i in xrange(len(string_arrays)):
+    with TimedContext():
+        string_arrays[i] = np.sort(string_arrays[i])
+
+for values in int_arrays:
+    print(int_checksum(values))
+for values in string_arrays:
+    print(string_checksum(values))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+
+import sys
+import time
+
+
+class TimedContext(object):
+
+    def __enter__(self):
+        self.t1 = time.time()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.t2 = time.time()
+        print(self.t2 - self.t1)
+
+
+if len(sys.argv) != 3:
+    sys.exit(1)
+
+chunk_size = int(sys.argv[2])
+
+with TimedContext():
+    word_counts = dict()
+    carry = ""
+
+    with open(sys.argv[1], "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            # the text contains no consecutive separators, so splitting on
+            # whitespace runs is equivalent to splitting on ' ' and '\n'
+            words = (carry + chunk).split()
+            # a chunk ending within a word continues in the next chunk
+            carry = words.pop() if not chunk[-1].isspace() and len(words) > 0 else ""
+
+            for w in words:
+                word_counts[w] = word_counts.get(w, 0) + 1
+
+    if carry:
+        word_counts[carry] = word_counts.get(carry, 0) + 1
+
+print(len(word_counts))
+word_checksum = 0
+for w, c in word_counts.iteritems():
+    word_checksum += c
+print(word_checksum)
@@ -4,6 +4,7 @@ from __future__ import division, print_function
 
 import argparse
 import os
+import sys
 
 from bench_suite.core import *
 
@@ -24,6 +25,69 @@ def parse_args():
         type=int,
         default=5,
         help="Number of repetitions for each benchmark (default: 3).")
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of benchmark runs to execute in parallel, each pinned\n"
+             "to its own physical core (default: 1, i.e., sequential and unpinned).")
+    parser.add_argument(
+        "--build-jobs",
+        type=int,
+        default=None,
+        help="Number of builds to run in parallel (default: number of CPUs).")
+    parser.add_argument(
+        "--rebuild",
+        action='store_true',
+        help="Ignore the build cache and rebuild all implementations.")
+    parser.add_argument(
+        "--resume",
+        action='store_true',
+        help="Skip runs which already have a valid result, i.e., only execute\n"
+             "missing or corrupt runs of an interrupted session.")
+    parser.add_argument(
+        "--adaptive",
+        action='store_true',
+        help="Determine the number of repetitions per benchmark and size adaptively,\n"
+             "based on the confidence interval of the median total run time.\n"
+             "Replaces --num-repetitions.")
+    parser.add_argument(
+        "--target-ci-width",
+        type=float,
+        default=0.05,
+        help="Adaptive mode: Target width of the 95%% confidence interval of the\n"
+             "median, relative to the median (default: 0.05).")
+    parser.add_argument(
+        "--min-repetitions",
+        type=int,
+        default=5,
+        help="Adaptive mode: Minimum number of repetitions (default: 5, at least 2).")
+    parser.add_argument(
+        "--max-repetitions",
+        type=int,
+        default=30,
+        help="Adaptive mode: Maximum number of repetitions (default: 30).")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=3600,
+        help="Default timeout of a single run in seconds, unless specified otherwise\n"
+             "by the benchmark or its benchmark.yml (default: 3600).")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Thread sweep: Additionally run the largest size of multithreaded entries\n"
+             "(multithreaded: true in benchmark.yml) with these numbers of threads.\n"
+             "All other runs are limited to a single thread via OMP_NUM_THREADS,\n"
+             "OPENBLAS_NUM_THREADS, and MKL_NUM_THREADS.")
+    parser.add_argument(
+        "--noise-check",
+        choices=["warn", "strict", "off"],
+        default="warn",
+        help="Pre-flight check of load average, CPU governor, turbo boost, and swap\n"
+             "activity: 'warn' reports issues, 'strict' refuses to run (default: warn).")
     parser.add_argument(
         "--benchmark",
         nargs="+",
@@ -34,10 +98,55 @@ def parse_args():
         nargs="+",
         default=[],
         help="Filter benchmarks to run by programming language(s).")
+    parser.add_argument(
+        "--import-results",
+        action='store_true',
+        help="Import results from the directory layout results/<lang>/<benchmark>/<impl>\n"
+             "(stdout_run_* files) into the result store before visualization.")
+    parser.add_argument(
+        "--list-sessions",
+        action='store_true',
+        help="List the recorded benchmark sessions and exit.")
+    parser.add_argument(
+        "--compare",
+        action='store_true',
+        help="Compare a session against a baseline instead of running/visualizing,\n"
+             "and exit with code 1 if there are significant regressions.")
+    parser.add_argument(
+        "--session",
+        type=int,
+        default=None,
+        help="Comparison: Session to check (default: latest session).")
+    parser.add_argument(
+        "--baseline",
+        type=int,
+        default=None,
+        help="Comparison: Baseline session (default: for each benchmark/size/stage\n"
+             "the most recent earlier session which contains it).")
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Comparison: Significance level of the Mann-Whitney U test (default: 0.05).")
+    parser.add_argument(
+        "--min-slowdown",
+        type=float,
+        default=0.05,
+        help="Comparison: Minimum relative slowdown of the median to report\n"
+             "a regression (default: 0.05).")
     parser.add_argument(
         "-p", "--plot-only",
         action='store_true',
         help="Do not re-run benchmarks, only visualize.")
+    parser.add_argument(
+        "--force-render",
+        action='store_true',
+        help="Re-render all pages, even if their inputs did not change.")
+    parser.add_argument(
+        "--include-throttled",
+        action='store_true',
+        help="Include runs during which CPU throttling was observed in the statistics\n"
+             "and in the comparison of sessions.")
     parser.add_argument(
         "-r", "--run-only",
         action='store_true',
@@ -50,6 +159,16 @@ def main():
 
     args = parse_args()
 
+    if args.list_sessions:
+        list_sessions()
+        return
+
+    if args.compare:
+        has_regressions = compare_with_baseline(
+            args.session, args.baseline, args.alpha, args.min_slowdown, args.include_throttled
+        )
+        sys.exit(1 if has_regressions else 0)
+
     if not args.plot_only:
         all_benchmark_entries = discover_benchmark_entries("implementations")
         benchmark_entries = filter_benchmark_entries(
@@ -57,24 +176,32 @@ def main():
             args.lang,
             args.benchmark,
         )
-        run_all_benchmarks(benchmark_entries, args.num_repetitions)
-
-    if not args.run_only:
-        all_benchmark_entries = discover_benchmark_entries("results")
-        # Note for visualization we probably never want to filter
-
-        affected_benchmarks = set([b_entry.benchmark_name for b_entry in all_benchmark_entries])
+        if args.adaptive:
+            adaptive = AdaptiveRepetitions(
+                args.target_ci_width,
+                args.min_repetitions,
+                args.max_repetitions,
+            )
+        else:
+            adaptive = None
+        run_all_benchmarks(
+            benchmark_entries,
+            args.num_repetitions,
+            num_jobs=args.jobs,
+            num_build_jobs=args.build_jobs,
+            use_build_cache=not args.rebuild,
+            resume=args.resume,
+            adaptive=adaptive,
+            default_timeout=args.timeout,
+            noise_check=args.noise_check,
+            thread_counts=args.threads,
+        )
 
-        for benchmark_name in affected_benchmarks:
-            entries_of_benchmark = [
-                b_entry for b_entry in all_benchmark_entries
-                if b_entry.benchmark_name == benchmark_name
-            ]
-            meta_data = benchmark_meta[benchmark_name]
-            generate_benchmark_html(benchmark_name, entries_of_benchmark, meta_data)
+    if args.import_results:
+        import_results(discover_benchmark_entries("results"))
 
-        generate_summary_html(affected_benchmarks, all_benchmark_entries)
-        generate_summary_markdown()
+    if not args.run_only:
+        visualize(force=args.force_render, include_throttled=args.include_throttled)
 
 
 if __name__ == "__main__":